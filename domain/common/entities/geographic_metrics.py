@@ -55,18 +55,16 @@ class GeographicMetrics:
     
     def export(self) -> dict:
         """Export GeographicMetrics to dictionary."""
-        result = {
+        # Built as one literal: the dict is sized once instead of grown key by key
+        return {
             'country_code': self.country_code,
-            'country_name': self.country_name
+            'country_name': self.country_name,
+            'views': self.views,
+            'watch_time_minutes': self.watch_time_minutes,
+            'subscribers_gained': self.subscribers_gained,
+            # Calculate percentage if we can
+            'percentage': 0.0  # Would need total to calculate
         }
-        
-        result['views'] = self.views
-        result['watch_time_minutes'] = self.watch_time_minutes
-        result['subscribers_gained'] = self.subscribers_gained
-        # Calculate percentage if we can
-        result['percentage'] = 0.0  # Would need total to calculate
-        
-        return result
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -1,7 +1,7 @@
 """YouTube daily metrics domain entity."""
 
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
 from typing import Optional, List
 from decimal import Decimal
 from ..value_objects.youtube_content_type import YouTubeContentType
@@ -71,7 +71,7 @@ class YouTubeDailyMetrics:
     def from_api_row(cls, row: List, with_content_type: bool = False) -> 'YouTubeDailyMetrics':
         """Create YouTubeDailyMetrics from API response row."""
         base_metrics = cls(
-            date=datetime.strptime(row[0], '%Y-%m-%d').date(),
+            date=date.fromisoformat(row[0]),
             views=row[1],
             watch_time_minutes=row[2] if not with_content_type else row[2],
             average_view_duration_seconds=row[3] if not with_content_type else 0,
@@ -31,7 +31,8 @@ class YouTubeMonthlyMetricsFactory(Factory):
         """Create YouTube monthly aggregated metrics.
         
         Returns:
-            Dictionary with month keys (YYYY-MM) and aggregated metrics
+            Dictionary with month keys (YYYY-MM) and aggregated metrics,
+            in chronological order
         """
         monthly_data = {}
         
@@ -68,8 +69,9 @@ class YouTubeMonthlyMetricsFactory(Factory):
             if month_key in self.geographic_subscribers_by_month:
                 monthly.geographic_subscribers_top = self.geographic_subscribers_by_month[month_key]
         
-        # Return exported data
+        # Return exported data; YYYY-MM keys sort chronologically, so
+        # consumers can iterate the result in order without sorting again
         return {
             month_key: metrics.export() 
-            for month_key, metrics in monthly_data.items()
+            for month_key, metrics in sorted(monthly_data.items())
         }
\ No newline at end of file
@@ -8,13 +8,14 @@ from typing import Optional, List, Tuple
 # Import modular components
 from youtube.youtube_api import YouTubeAPIClient
 from youtube.youtube_metrics_factory import YouTubeMetricsFactory
+from youtube.response_cache import ResponseCache
 
 
-def parse_arguments() -> Tuple[str, Optional[List[int]], Optional[Tuple[str, str]], bool, Optional[List[str]], bool, bool]:
+def parse_arguments() -> Tuple[str, Optional[List[int]], Optional[Tuple[str, str]], bool, Optional[List[str]], bool, bool, bool]:
     """Parse command line arguments.
     
     Returns:
-        Tuple of (spreadsheet_id, channel_indices, date_filter, dry_run, channel_names, skip_revenue, json_export)
+        Tuple of (spreadsheet_id, channel_indices, date_filter, dry_run, channel_names, skip_revenue, json_export, no_cache)
     """
     # Default values
     spreadsheet_id = "1YBazG-UVCnSYwYjSKmXwaySVFDaQuifsL14aWTq7S9U"  # Default spreadsheet
@@ -24,11 +25,13 @@ def parse_arguments() -> Tuple[str, Optional[List[int]], Optional[Tuple[str, str
     channel_names = None
     skip_revenue = False
     json_export = False
+    no_cache = False
     
     # Parse flags
     dry_run = '--dry-run' in sys.argv or '-d' in sys.argv
     skip_revenue = '--skip-revenue' in sys.argv
     json_export = '--json' in sys.argv
+    no_cache = '--no-cache' in sys.argv
     
     # Parse date range
     start_date = None
@@ -84,7 +87,7 @@ def parse_arguments() -> Tuple[str, Optional[List[int]], Optional[Tuple[str, str
             print("Use format: 0,1,2 or just 1 for single channel")
             sys.exit(1)
     
-    return spreadsheet_id, channel_indices, date_filter, dry_run, channel_names, skip_revenue, json_export
+    return spreadsheet_id, channel_indices, date_filter, dry_run, channel_names, skip_revenue, json_export, no_cache
 
 
 def resolve_channel_identifier(youtube_data_service, channel_identifier: str) -> Optional[str]:
@@ -165,7 +168,8 @@ def update_channel_in_spreadsheet(
     date_filter: Optional[Tuple[str, str]],
     dry_run: bool,
     skip_revenue: bool = False,
-    json_export: bool = False
+    json_export: bool = False,
+    use_cache: bool = True
 ) -> None:
     """Update a single channel's data in the spreadsheet or export to JSON.
     
@@ -177,6 +181,7 @@ def update_channel_in_spreadsheet(
         dry_run: If True, show what would be done without making changes
         skip_revenue: If True, skip fetching revenue data
         json_export: If True, export to JSON instead of Google Sheets
+        use_cache: If False, do not reuse monthly aggregations cached on disk
     """
     # Determine date range
     if date_filter:
@@ -208,7 +213,8 @@ def update_channel_in_spreadsheet(
             base_factory=youtube_factory,
             wrapper_class=YoutubeMetricsSheetsReport,
             spreadsheet_id=spreadsheet_id,
-            sheet_name='YouTube'
+            sheet_name='YouTube',
+            use_cache=use_cache
         )
     elif json_export and not dry_run:
         # Wrap with JSON export capability
@@ -279,12 +285,15 @@ def main():
         
         # Export to JSON instead of Google Sheets
         python main.py --json --range 2024-01-01:2024-12-31
+        
+        # Refetch from the API and recompute monthly aggregations instead of using the on-disk caches
+        python main.py 1YrSnJyJq0xZ87QW9LzP0ODY8gfTjp_ZKqQRS2YW-A3I 0 --no-cache
     """
     print("YouTube Analytics")
     print("="*60)
     
     # Parse arguments
-    spreadsheet_id, channel_indices, date_filter, dry_run, channel_names, skip_revenue, json_export = parse_arguments()
+    spreadsheet_id, channel_indices, date_filter, dry_run, channel_names, skip_revenue, json_export, no_cache = parse_arguments()
     
     if date_filter:
         print(f"Date filter: {date_filter[0] or 'any'} to {date_filter[1] or 'any'}")
@@ -292,9 +301,12 @@ def main():
         print("Skipping revenue data (--skip-revenue flag set)")
     if json_export:
         print("Exporting to JSON format (--json flag set)")
+    if no_cache:
+        print("Ignoring cached API responses and monthly data (--no-cache flag set)")
     
-    # Initialize API client
-    api_client = YouTubeAPIClient()
+    # Initialize API client; past periods and recent channel data are
+    # answered from the response cache unless caching is disabled
+    api_client = YouTubeAPIClient(response_cache=None if no_cache else ResponseCache())
     
     # Get YouTube Data service for channel resolution
     _, youtube_data = api_client.get_services()
@@ -332,7 +344,8 @@ def main():
                 date_filter=date_filter,
                 dry_run=dry_run,
                 skip_revenue=skip_revenue,
-                json_export=json_export
+                json_export=json_export,
+                use_cache=not no_cache
             )
         except Exception as e:
             print(f"Error updating channel {idx}: {e}")
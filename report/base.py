@@ -1,9 +1,23 @@
 """Base Report abstraction using decorator pattern."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=4096)
+def iso_format(value: Any) -> str:
+    """Return the ISO 8601 string for a date or datetime, cached per value.
+    
+    Args:
+        value: date or datetime to format
+        
+    Returns:
+        ISO formatted string
+    """
+    return value.isoformat()
+
+
 class Report(ABC):
     """Abstract base class for reports using decorator pattern.
     
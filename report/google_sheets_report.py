@@ -3,7 +3,7 @@
 import gspread
 from gspread_formatting import *
 from google.oauth2.credentials import Credentials
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, ClassVar, Tuple, FrozenSet
 import pickle
 import os
 from datetime import datetime
@@ -20,13 +20,26 @@ class GoogleSheetsReport(Report):
         'blue': 0.6
     }
     
+    # Authorized client shared by every export in the process. gspread talks
+    # through a google-auth AuthorizedSession (a pooled requests.Session that
+    # refreshes the token on its own), so reusing the client keeps the
+    # TLS connection to the Sheets API alive between exports. Keyed by the
+    # scopes the client was authorized with, so a client holding narrower
+    # credentials is never handed to a request that needs more.
+    _client_cache: ClassVar[Dict[FrozenSet[str], gspread.Client]] = {}
+    
+    # Spreadsheet and worksheet handles by (spreadsheet_id, sheet_name), so
+    # repeated exports to the same tab skip the metadata round-trips
+    _sheet_cache: ClassVar[Dict[Tuple[str, str], Tuple[gspread.Spreadsheet, gspread.Worksheet]]] = {}
+    
     def __init__(
         self, 
         data: Union[Dict[str, Any], List[Dict[str, Any]]], 
         spreadsheet_id: Optional[str] = None,
         sheet_name: Optional[str] = None,
         create_new: bool = False,
-        share_emails: Optional[List[str]] = None
+        share_emails: Optional[List[str]] = None,
+        use_cache: bool = True
     ):
         """Initialize Google Sheets exporter.
         
@@ -36,6 +49,7 @@ class GoogleSheetsReport(Report):
             sheet_name: Name of the sheet/tab to write to
             create_new: Whether to create a new spreadsheet
             share_emails: List of emails to share the spreadsheet with
+            use_cache: Whether subclasses may reuse on-disk cached intermediate data
         """
         super().__init__(data)
         self.data = data
@@ -43,6 +57,7 @@ class GoogleSheetsReport(Report):
         self.sheet_name = sheet_name or 'Sheet1'
         self.create_new = create_new
         self.share_emails = share_emails or []
+        self.use_cache = use_cache
         self.client = None
         self.spreadsheet = None
         self.worksheet = None
@@ -50,16 +65,12 @@ class GoogleSheetsReport(Report):
     def _authenticate(self) -> gspread.Client:
         """Authenticate with Google Sheets API using existing OAuth token.
         
+        The client is created once per set of scopes and cached on
+        GoogleSheetsReport.
+        
         Returns:
             Authenticated gspread client
         """
-        from google.auth.transport.requests import Request
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        
-        # Use existing token.pickle from YouTube API authentication
-        token_path = 'token.pickle'
-        creds = None
-        
         # The required scopes for both YouTube Analytics and Google Sheets
         SCOPES = [
             'https://www.googleapis.com/auth/yt-analytics.readonly',
@@ -67,6 +78,18 @@ class GoogleSheetsReport(Report):
             'https://www.googleapis.com/auth/spreadsheets'
         ]
         
+        cache_key = frozenset(SCOPES)
+        cached_client = GoogleSheetsReport._client_cache.get(cache_key)
+        if cached_client is not None:
+            return cached_client
+        
+        from google.auth.transport.requests import Request
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        
+        # Use existing token.pickle from YouTube API authentication
+        token_path = 'token.pickle'
+        creds = None
+        
         if os.path.exists(token_path):
             with open(token_path, 'rb') as token:
                 creds = pickle.load(token)
@@ -100,8 +123,9 @@ class GoogleSheetsReport(Report):
                     "client_secrets.json not found. Please ensure OAuth credentials are configured."
                 )
         
-        # Create gspread client
+        # Create gspread client and keep it for later exports
         client = gspread.authorize(creds)
+        GoogleSheetsReport._client_cache[cache_key] = client
         return client
     
     def _get_or_create_spreadsheet(self) -> gspread.Spreadsheet:
@@ -144,6 +168,42 @@ class GoogleSheetsReport(Report):
         
         return worksheet
     
+    def _open_sheet(self) -> None:
+        """Set self.spreadsheet and self.worksheet, reusing cached handles.
+        
+        Handles are only reused for an existing spreadsheet; create_new
+        always creates a fresh one (which is then cached under its new id).
+        """
+        if not self.create_new and self.spreadsheet_id:
+            cached = GoogleSheetsReport._sheet_cache.get((self.spreadsheet_id, self.sheet_name))
+            if cached is not None:
+                self.spreadsheet, self.worksheet = cached
+                return
+        
+        self.spreadsheet = self._get_or_create_spreadsheet()
+        self.worksheet = self._get_or_create_worksheet()
+        GoogleSheetsReport._sheet_cache[(self.spreadsheet_id, self.sheet_name)] = (
+            self.spreadsheet, self.worksheet
+        )
+    
+    def _values_batch_update(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a spreadsheets.values.batchUpdate for the open spreadsheet.
+        
+        Goes through gspread's request path, so API errors, retries and token
+        refresh are handled as for every other call.
+        
+        Args:
+            body: Request body with valueInputOption and data
+            
+        Returns:
+            API response
+        """
+        return self.spreadsheet.values_batch_update(body)
+    
+    def _forget_sheet(self) -> None:
+        """Drop the cached handles for this report's sheet (e.g. after an API error)."""
+        GoogleSheetsReport._sheet_cache.pop((self.spreadsheet_id, self.sheet_name), None)
+    
     def _format_headers(self, worksheet: gspread.Worksheet, num_cols: int):
         """Apply formatting to header row.
         
@@ -246,20 +306,23 @@ class GoogleSheetsReport(Report):
         Returns:
             URL of the spreadsheet
         """
-        # Authenticate
-        self.client = self._authenticate()
+        # Authenticate unless this report already holds a client
+        if self.client is None:
+            self.client = self._authenticate()
         
-        # Get or create spreadsheet
-        self.spreadsheet = self._get_or_create_spreadsheet()
-        
-        # Get or create worksheet
-        self.worksheet = self._get_or_create_worksheet()
+        # Get or create spreadsheet and worksheet (cached across exports)
+        self._open_sheet()
         
         # Write data based on type
-        if isinstance(self.data, list):
-            self._write_list_data(self.data)
-        else:
-            self._write_dict_data(self.data)
+        try:
+            if isinstance(self.data, list):
+                self._write_list_data(self.data)
+            else:
+                self._write_dict_data(self.data)
+        except Exception:
+            # The cached handles may be stale (e.g. the tab was deleted)
+            self._forget_sheet()
+            raise
         
         # Return spreadsheet URL
         return f"https://docs.google.com/spreadsheets/d/{self.spreadsheet.id}"
\ No newline at end of file
@@ -1,25 +1,84 @@
 """JSON Report implementation."""
 
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TextIO
 from .base import Report
 
+try:
+    # Optional C encoder, several times faster than json on large reports
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class JsonReport(Report):
     """Export dictionary to JSON format using decorator pattern."""
     
-    def __init__(self, data: Dict[str, Any], indent: int = 2, ensure_ascii: bool = False):
+    def __init__(self, data: Dict[str, Any], indent: Optional[int] = None, ensure_ascii: bool = False,
+                 include_metadata: bool = True):
         """Initialize JSON exporter with a dictionary.
         
         Args:
             data: Dictionary to export as JSON
-            indent: JSON indentation level
+            indent: JSON indentation level; None produces compact output for
+                    machine consumers (use pretty() for human-readable output)
             ensure_ascii: Whether to escape non-ASCII characters
+            include_metadata: Whether to add the '_metadata' block; when False the
+                              data is serialized as-is without being copied
         """
         super().__init__(data)
         self.data = data
         self.indent = indent
         self.ensure_ascii = ensure_ascii
+        self.include_metadata = include_metadata
+    
+    def _export_data(self) -> Dict[str, Any]:
+        """Get the data to serialize, with metadata added if enabled.
+        
+        Returns:
+            Dictionary to serialize
+        """
+        export_data = self.data
+        
+        # Add metadata to the exported data
+        if self.include_metadata:
+            export_data = dict(export_data)
+            if '_metadata' not in export_data:
+                export_data['_metadata'] = {}
+            
+            export_data['_metadata']['exporter'] = 'JsonReport'
+        
+        return export_data
+    
+    def _orjson_dumps(self, export_data: Dict[str, Any]) -> Optional[str]:
+        """Encode with orjson when it is installed and the options allow it.
+        
+        Dates, datetimes and dataclasses are passed through to default=str like
+        json does, and non-string keys are accepted. Only 2-space indented,
+        non-ASCII-escaped output is attempted: orjson's compact form drops the
+        spaces after separators.
+        
+        The text matches json's for the strings, integers, Decimals and
+        ordinary floats in reports, but not for every value: orjson writes
+        NaN and infinity as null, prints some floats differently (1e16 rather
+        than 1e+16) and encodes Enum members by value. Integers wider than
+        64 bits make orjson fail; json is used for those documents.
+        
+        Args:
+            export_data: Data to serialize
+        
+        Returns:
+            JSON text, or None when json must be used
+        """
+        if orjson is None or self.ensure_ascii or self.indent != 2:
+            return None
+        
+        option = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                  | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        try:
+            return orjson.dumps(export_data, default=str, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return None
     
     def export(self) -> str:
         """Export dictionary to JSON string.
@@ -27,16 +86,53 @@ class JsonReport(Report):
         Returns:
             JSON formatted string
         """
-        # Add metadata to the exported data
-        export_data = dict(self.data)
-        if '_metadata' not in export_data:
-            export_data['_metadata'] = {}
-        
-        export_data['_metadata']['exporter'] = 'JsonReport'
+        export_data = self._export_data()
+        text = self._orjson_dumps(export_data)
+        if text is not None:
+            return text
         
         return json.dumps(
             export_data,
             indent=self.indent,
             ensure_ascii=self.ensure_ascii,
             default=str  # Handle datetime and other non-serializable types
-        )
\ No newline at end of file
+        )
+    
+    def write(self, f: TextIO) -> None:
+        """Serialize straight into an open text file.
+        
+        Produces the same text as export() without building it as one string
+        first; the encoder's chunks go through the file's write buffer.
+        
+        Args:
+            f: File opened for writing in text mode
+        """
+        export_data = self._export_data()
+        text = self._orjson_dumps(export_data)
+        if text is not None:
+            f.write(text)
+            return
+        
+        json.dump(
+            export_data,
+            f,
+            indent=self.indent,
+            ensure_ascii=self.ensure_ascii,
+            default=str  # Handle datetime and other non-serializable types
+        )
+    
+    def pretty(self, indent: int = 2) -> str:
+        """Export dictionary to an indented, human-readable JSON string.
+        
+        Args:
+            indent: JSON indentation level
+            
+        Returns:
+            Pretty-printed JSON string
+        """
+        return JsonReport(
+            self.data,
+            indent=indent,
+            ensure_ascii=self.ensure_ascii,
+            include_metadata=self.include_metadata
+        ).export()
\ No newline at end of file
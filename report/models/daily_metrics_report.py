@@ -1,7 +1,7 @@
 """Exported wrapper for DailyMetrics model."""
 
 from domain import DailyMetrics
-from ..base import Report
+from ..base import Report, iso_format
 
 
 class DailyMetricsReport(Report):
@@ -14,7 +14,7 @@ class DailyMetricsReport(Report):
     def export(self) -> dict:
         """Export DailyMetrics to dictionary."""
         result = {
-            'date': self.date.isoformat(),
+            'date': iso_format(self.date),
             'views': self.views,
             'watch_time_minutes': self.watch_time_minutes,
             'average_view_duration_seconds': self.average_view_duration_seconds,
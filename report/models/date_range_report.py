@@ -1,7 +1,7 @@
 """Exported wrapper for DateRange model."""
 
 from domain import DateRange
-from ..base import Report
+from ..base import Report, iso_format
 
 
 class DateRangeReport(Report):
@@ -15,6 +15,6 @@ class DateRangeReport(Report):
         """Export DateRange to dictionary."""
         # Convert dates to strings
         return {
-            'start_date': self.start_date.isoformat(),
-            'end_date': self.end_date.isoformat()
+            'start_date': iso_format(self.start_date),
+            'end_date': iso_format(self.end_date)
         }
\ No newline at end of file
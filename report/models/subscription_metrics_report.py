@@ -16,15 +16,12 @@ class SubscriptionMetricsReport(Report):
         
         Uses DateRangeExported for the period field if needed.
         """
-        result = {
+        # Just call export() on period - trust it has the method
+        period = self.period
+        return {
             'subscribers_gained': self.subscribers_gained,
             'subscribers_lost': self.subscribers_lost,
             'net_change': self.net_change,
-            'change_percentage': self.change_percentage
-        }
-        
-        # Just call export() on period - trust it has the method
-        if self.period:
-            result['period'] = self.period.export()
-        
-        return result
\ No newline at end of file
+            'change_percentage': self.change_percentage,
+            **({'period': period.export()} if period else {})
+        }
\ No newline at end of file
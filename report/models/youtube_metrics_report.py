@@ -1,7 +1,7 @@
 """Report wrapper for YouTubeMetrics model."""
 
 from domain import YouTubeMetrics
-from ..base import Report
+from ..base import Report, iso_format
 
 
 class YoutubeMetricsReport(Report):
@@ -26,7 +26,7 @@ class YoutubeMetricsReport(Report):
         result = {
             'channel': channel_data,
             'period': period_data,
-            'generated_at': self.generated_at.isoformat()
+            'generated_at': iso_format(self.generated_at)
         }
         
         # Export required fields - just call export() directly
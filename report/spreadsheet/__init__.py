@@ -4,6 +4,8 @@
 from .spreadsheet_fragment import SpreadsheetFragment
 from .formatted_spreadsheet_fragment import FormattedSpreadsheetFragment
 from .merged_spreadsheet_fragment import MergedSpreadsheetFragment, VerticalMergedSpreadsheetFragment
+from .spreadsheet_fragment_builder import SpreadsheetFragmentBuilder
+from .monthly_table import MonthlyTable
 
 # Factories
 from .sheets_report_factory import SheetsReportFactory
@@ -24,6 +26,8 @@ __all__ = [
     'FormattedSpreadsheetFragment',
     'MergedSpreadsheetFragment',
     'VerticalMergedSpreadsheetFragment',
+    'SpreadsheetFragmentBuilder',
+    'MonthlyTable',
     # Factories
     'SheetsReportFactory',
     # Google Sheets reports
@@ -3,6 +3,7 @@
 from typing import List
 from domain import Factory, FactoryDecorator
 from ..spreadsheet_fragment import SpreadsheetFragment
+from ..monthly_table import MonthlyTable
 from domain import Channel
 
 
@@ -26,15 +27,15 @@ class ChannelFragmentFactory(FactoryDecorator):
         Args:
             **kwargs: Must include:
                 - channel: Channel object to export
-                - months: List of month keys (YYYY-MM format)
-                - monthly_data: Optional dict with monthly metrics including video counts
+                - monthly_table: MonthlyTable with the month axis and video counts
+                  (or monthly_data and months, as in earlier callers)
             
         Returns:
             SpreadsheetFragment with channel data
         """
         channel = kwargs.get('channel')
-        months = kwargs.get('months', [])
-        monthly_data = kwargs.get('monthly_data', {})
+        monthly_table = MonthlyTable.from_kwargs(kwargs)
+        months = monthly_table.months
         
         if not channel:
             return self.factory.create()
@@ -42,25 +43,25 @@ class ChannelFragmentFactory(FactoryDecorator):
         # Use the wrapped factory to create base fragment
         fragment = self.factory.create()
         
+        rows = []
+        
         # Row 1: Video count (from monthly data if available, otherwise use total)
         row1 = ['Количество роликов']
-        for month in months:
-            if month in monthly_data and 'video_count' in monthly_data[month]:
-                video_count = monthly_data[month]['video_count']
-            else:
+        for video_count in monthly_table.column('video_count'):
+            if video_count is None:
                 # Fallback to total if monthly data not available
                 video_count = channel.video_count
-            row1.extend([str(video_count), '', ''])
-        fragment = fragment.with_row(row1)
+            row1.extend([video_count, '', ''])
+        rows.append(row1)
         
         # Row 2: Advertiser count (placeholder)
         row2 = ['Количество рекламодателей']
         for _ in months:
             if channel.advertiser_count is not None:
-                row2.extend([str(channel.advertiser_count), '', ''])
+                row2.extend([channel.advertiser_count, '', ''])
             else:
                 row2.extend(['[Требуется ручной ввод]', '', ''])
-        fragment = fragment.with_row(row2)
+        rows.append(row2)
         
         # Row 3: Integrations (placeholder)
         row3 = ['Интеграции Ghost Writer или Школьных продуктов']
@@ -69,6 +70,6 @@ class ChannelFragmentFactory(FactoryDecorator):
                 row3.extend([channel.integrations, '', ''])
             else:
                 row3.extend(['[Требуется ручной ввод]', '', ''])
-        fragment = fragment.with_row(row3)
+        rows.append(row3)
         
-        return fragment
\ No newline at end of file
+        return fragment.with_rows(rows)
\ No newline at end of file
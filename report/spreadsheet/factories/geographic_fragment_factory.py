@@ -1,8 +1,16 @@
 """Geographic fragment factory for creating geographic data fragments."""
 
-from typing import List, Dict, Any
 from domain import Factory, FactoryDecorator
 from ..spreadsheet_fragment import SpreadsheetFragment
+from ..monthly_table import MonthlyTable
+from ..formatted_spreadsheet_fragment import FormattedSpreadsheetFragment, CellFormat, RangeFormat
+
+
+# Three blank cells (country, number, percentage) for a month without data
+_EMPTY_TRIPLE = ('', '', '')
+
+# Percentages are written as fractions and displayed through this format
+_PERCENT_FMT = CellFormat(number_format='0.0%')
 
 
 class GeographicFragmentFactory(FactoryDecorator):
@@ -24,40 +32,48 @@ class GeographicFragmentFactory(FactoryDecorator):
         
         Args:
             **kwargs: Must include:
-                - monthly_data: Dictionary with month keys and metric values including geographic data
-                - months: Sorted list of month keys
+                - monthly_table: MonthlyTable with metric columns including geographic data
+                  (or monthly_data and months, as in earlier callers)
             
         Returns:
-            SpreadsheetFragment with geographic data
+            Formatted SpreadsheetFragment with geographic data
         """
-        monthly_data = kwargs.get('monthly_data', {})
-        months = kwargs.get('months', [])
+        monthly_table = MonthlyTable.from_kwargs(kwargs)
+        months = monthly_table.months
+        
+        # Blank month cells shared by every padding row
+        empty_cells = _EMPTY_TRIPLE * len(months)
+        
+        # Pair each month's top countries with its total, column by column
+        views_by_month = list(zip(
+            monthly_table.column('geographic_views_top', ()),
+            monthly_table.column('views', 0)
+        ))
+        subscribers_by_month = list(zip(
+            monthly_table.column('geographic_subscribers_top', ()),
+            monthly_table.column('subscribers_gained', 0)
+        ))
         
         # Use the wrapped factory to create base fragment
         fragment = self.factory.create()
         
+        rows = []
+        
         # Section header for geographic views
         header_row = ['География просмотров']
-        for _ in months:
-            header_row.extend(['', '', ''])
-        fragment = fragment.with_row(header_row)
+        header_row.extend(empty_cells)
+        rows.append(header_row)
         
         # Find max number of countries across all months
         max_countries = 0
-        for month_key in months:
-            month_data = monthly_data.get(month_key, {})
-            geo_views = month_data.get('geographic_views_top', [])
+        for geo_views, _ in views_by_month:
             max_countries = max(max_countries, len(geo_views))
         
         # Add countries by views (up to max found or 9, whichever is smaller)
         rows_to_show = min(max_countries, 9)
         for i in range(rows_to_show):
             row = [f'География, топ-{i+1}']
-            for month_key in months:
-                month_data = monthly_data.get(month_key, {})
-                geo_views = month_data.get('geographic_views_top', [])
-                total_views = month_data.get('views', 0)
-                
+            for geo_views, total_views in views_by_month:
                 if i < len(geo_views):
                     # geo_views contains GeographicMetrics objects or dicts
                     if isinstance(geo_views[i], dict):
@@ -68,23 +84,19 @@ class GeographicFragmentFactory(FactoryDecorator):
                         country = geo_views[i].country_code if hasattr(geo_views[i], 'country_code') else ''
                         views = geo_views[i].views if hasattr(geo_views[i], 'views') else 0
                     
-                    # Calculate percentage
-                    percentage = round((views / total_views * 100), 1) if total_views > 0 else 0
+                    # Share of the month's views, displayed as a percentage by _PERCENT_FMT
+                    share = views / total_views if views and total_views > 0 else ''
                     
                     # Spread across 3 cells: country code, number, percentage
-                    row.extend([country, str(views) if views else '', f"{percentage}%" if percentage else ''])
+                    row.extend([country, views if views else '', share])
                 else:
                     # Empty cells
-                    row.extend(['', '', ''])
-            fragment = fragment.with_row(row)
+                    row.extend(_EMPTY_TRIPLE)
+            rows.append(row)
         
         # Add "Other" row for remaining views not in top countries (right after last country)
         other_row = ['География, остальные']
-        for month_key in months:
-            month_data = monthly_data.get(month_key, {})
-            geo_views = month_data.get('geographic_views_top', [])
-            total_views = month_data.get('views', 0)
-            
+        for geo_views, total_views in views_by_month:
             # Calculate sum of top countries' views
             top_countries_views = 0
             for geo in geo_views:
@@ -96,45 +108,40 @@ class GeographicFragmentFactory(FactoryDecorator):
             # Calculate "Other" views
             other_views = total_views - top_countries_views
             if other_views > 0:
-                percentage = round((other_views / total_views * 100), 1) if total_views > 0 else 0
-                other_row.extend(['Other', str(other_views), f"{percentage}%"])
+                other_row.extend(['Other', other_views, other_views / total_views])
             else:
-                other_row.extend(['', '', ''])
-        fragment = fragment.with_row(other_row)
+                other_row.extend(_EMPTY_TRIPLE)
+        rows.append(other_row)
+        
+        # Rows holding percentages, formatted below
+        percent_row_ranges = [(1, len(rows) - 1)]
         
         # Add empty rows to reach 9 total if needed
         for i in range(rows_to_show + 1, 9):  # +1 to account for "Other" row
             row = [f'География, топ-{i+1}']
-            for _ in months:
-                row.extend(['', '', ''])
-            fragment = fragment.with_row(row)
+            row.extend(empty_cells)
+            rows.append(row)
         
         # Empty row before subscribers section
-        empty_row = [''] * (1 + 3 * len(months))
-        fragment = fragment.with_row(empty_row)
+        empty_row = ('',) + empty_cells
+        rows.append(empty_row)
         
         # Section header for geographic subscribers
         sub_header_row = ['География подписчиков']
-        for _ in months:
-            sub_header_row.extend(['', '', ''])
-        fragment = fragment.with_row(sub_header_row)
+        sub_header_row.extend(empty_cells)
+        rows.append(sub_header_row)
         
         # Find max number of countries with subscribers across all months
         max_sub_countries = 0
-        for month_key in months:
-            month_data = monthly_data.get(month_key, {})
-            geo_subs = month_data.get('geographic_subscribers_top', [])
+        for geo_subs, _ in subscribers_by_month:
             max_sub_countries = max(max_sub_countries, len(geo_subs))
         
         # Add countries by subscribers (up to max found or 5, whichever is smaller)
         sub_rows_to_show = min(max_sub_countries, 5)
+        first_sub_row = len(rows)
         for i in range(sub_rows_to_show):
             row = [f'топ-{i+1}']
-            for month_key in months:
-                month_data = monthly_data.get(month_key, {})
-                geo_subs = month_data.get('geographic_subscribers_top', [])
-                total_subscribers = month_data.get('subscribers_gained', 0)
-                
+            for geo_subs, total_subscribers in subscribers_by_month:
                 if i < len(geo_subs):
                     # geo_subs contains GeographicMetrics objects or dicts
                     if isinstance(geo_subs[i], dict):
@@ -145,24 +152,20 @@ class GeographicFragmentFactory(FactoryDecorator):
                         country = geo_subs[i].country_code if hasattr(geo_subs[i], 'country_code') else ''
                         subscribers = geo_subs[i].subscribers_gained if hasattr(geo_subs[i], 'subscribers_gained') else 0
                     
-                    # Calculate percentage
-                    percentage = round((subscribers / total_subscribers * 100), 1) if total_subscribers > 0 else 0
+                    # Share of the month's new subscribers
+                    share = subscribers / total_subscribers if subscribers and total_subscribers > 0 else ''
                     
                     # Spread across 3 cells: country code, number, percentage
-                    row.extend([country, str(subscribers) if subscribers else '', f"{percentage}%" if percentage else ''])
+                    row.extend([country, subscribers if subscribers else '', share])
                 else:
                     # Empty cells
-                    row.extend(['', '', ''])
-            fragment = fragment.with_row(row)
+                    row.extend(_EMPTY_TRIPLE)
+            rows.append(row)
         
         # Add "Other" row for remaining subscribers not in top countries (right after last country)
         if sub_rows_to_show > 0:  # Only add if there's at least one country
             other_sub_row = ['остальные']
-            for month_key in months:
-                month_data = monthly_data.get(month_key, {})
-                geo_subs = month_data.get('geographic_subscribers_top', [])
-                total_subscribers = month_data.get('subscribers_gained', 0)
-                
+            for geo_subs, total_subscribers in subscribers_by_month:
                 # Calculate sum of top countries' subscribers
                 top_countries_subs = 0
                 for geo in geo_subs:
@@ -174,24 +177,32 @@ class GeographicFragmentFactory(FactoryDecorator):
                 # Calculate "Other" subscribers
                 other_subs = total_subscribers - top_countries_subs
                 if other_subs > 0:
-                    percentage = round((other_subs / total_subscribers * 100), 1) if total_subscribers > 0 else 0
-                    other_sub_row.extend(['Other', str(other_subs), f"{percentage}%"])
+                    other_sub_row.extend(['Other', other_subs, other_subs / total_subscribers])
                 else:
-                    other_sub_row.extend(['', '', ''])
-            fragment = fragment.with_row(other_sub_row)
+                    other_sub_row.extend(_EMPTY_TRIPLE)
+            rows.append(other_sub_row)
+            percent_row_ranges.append((first_sub_row, len(rows) - 1))
             
             # Add empty rows to reach 5 total if needed
             for i in range(sub_rows_to_show + 1, 5):  # +1 to account for "Other" row
                 row = [f'топ-{i+1}']
-                for _ in months:
-                    row.extend(['', '', ''])
-                fragment = fragment.with_row(row)
+                row.extend(empty_cells)
+                rows.append(row)
         else:
             # No subscriber data, just add 5 empty rows
             for i in range(5):
                 row = [f'топ-{i+1}']
-                for _ in months:
-                    row.extend(['', '', ''])
-                fragment = fragment.with_row(row)
+                row.extend(empty_cells)
+                rows.append(row)
+        
+        fragment = fragment.with_rows(rows)
+        
+        # Percentage format for the third cell of every month block, on the
+        # country and "Other" rows only
+        formats = [
+            RangeFormat(start_row, col, end_row, col, _PERCENT_FMT)
+            for start_row, end_row in percent_row_ranges
+            for col in range(3, 1 + 3 * len(months), 3)
+        ]
         
-        return fragment
\ No newline at end of file
+        return FormattedSpreadsheetFragment(fragment, formats)
\ No newline at end of file
@@ -1,11 +1,38 @@
 """Header fragment factory for creating spreadsheet header fragments."""
 
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from domain import Factory, FactoryDecorator
-from ..spreadsheet_fragment import SpreadsheetFragment
+from ..spreadsheet_fragment import SpreadsheetFragment, EMPTY_MONTH_BLOCK
 from ..formatted_spreadsheet_fragment import FormattedSpreadsheetFragment, CellFormat, RangeFormat
 
 
+# Shared header formats
+_HEADER_FMT = CellFormat(bold=True, font_size=11)
+_MONTH_FMT = CellFormat(bold=True, font_size=10, horizontal_align="center", background_color="#E8F0FE")
+_BOLD_FMT = CellFormat(bold=True)
+
+
+@lru_cache(maxsize=64)
+def _parse_month_labels(months: Tuple[str, ...],
+                        month_names_items: Tuple[Tuple[int, str], ...]) -> Tuple[str, ...]:
+    """Build the "<month name>. <year>" label for each YYYY-MM key.
+    
+    Args:
+        months: Month keys in YYYY-MM format
+        month_names_items: Month number to name pairs
+        
+    Returns:
+        Tuple of labels in the same order as months
+    """
+    month_names = dict(month_names_items)
+    labels = []
+    for month_key in months:
+        year, month = map(int, month_key.split('-'))
+        labels.append(f"{month_names.get(month, str(month))}. {year}")
+    return tuple(labels)
+
+
 class HeaderFragmentFactory(FactoryDecorator):
     """Factory decorator for creating header row fragments.
     
@@ -26,46 +53,44 @@ class HeaderFragmentFactory(FactoryDecorator):
         Args:
             **kwargs: Must include:
                 - months: List of month keys (YYYY-MM format)
-                - month_names_ru: Russian month names mapping
+                - month_headers: Pre-rendered label per month; when omitted,
+                  labels are built from month_names_ru (Russian month names mapping)
             
         Returns:
             Formatted SpreadsheetFragment with header rows
         """
         months = kwargs.get('months', [])
-        month_names_ru = kwargs.get('month_names_ru', {})
+        month_headers = kwargs.get('month_headers')
         
         # Use the wrapped factory to create base fragment
         fragment = self.factory.create()
         
+        rows = []
+        
         # Row 1: MM header
-        row1 = ['MM'] + ['', '', ''] * len(months)
-        fragment = fragment.with_row(row1)
+        row1 = ['MM']
+        row1.extend(EMPTY_MONTH_BLOCK * len(months))
+        rows.append(row1)
         
         # Row 2: Month headers
-        row2 = ['']
-        for month_key in months:
-            year, month = map(int, month_key.split('-'))
-            month_name = month_names_ru.get(month, str(month))
-            month_header = f"{month_name}. {year}"
-            row2.extend([month_header, '', ''])
-        fragment = fragment.with_row(row2)
+        if month_headers is None:
+            month_names_ru = kwargs.get('month_names_ru', {})
+            month_headers = _parse_month_labels(tuple(months), tuple(month_names_ru.items()))
+        row2 = [''] + [cell for label in month_headers for cell in (label, '', '')]
+        rows.append(row2)
+        fragment = fragment.with_rows(rows)
         
         # Apply header formatting
         formats = []
         
         # Bold first two rows (MM and month headers)
         if len(fragment.rows) >= 2:
-            num_cols = max(len(row) for row in fragment.rows) if fragment.rows else 0
-            formats.append(RangeFormat(0, 0, 0, num_cols - 1, CellFormat(bold=True, font_size=11)))
-            formats.append(RangeFormat(1, 0, 1, num_cols - 1, CellFormat(
-                bold=True, 
-                font_size=10,
-                horizontal_align="center",
-                background_color="#E8F0FE"
-            )))
+            num_cols = fragment.num_cols
+            formats.append(RangeFormat(0, 0, 0, num_cols - 1, _HEADER_FMT))
+            formats.append(RangeFormat(1, 0, 1, num_cols - 1, _MONTH_FMT))
         
         # Bold first column (metric names)
         num_rows = len(fragment.rows)
-        formats.append(RangeFormat(0, 0, num_rows - 1, 0, CellFormat(bold=True)))
+        formats.append(RangeFormat(0, 0, num_rows - 1, 0, _BOLD_FMT))
         
         return FormattedSpreadsheetFragment(fragment, formats)
\ No newline at end of file
@@ -1,11 +1,32 @@
 """Monthly metrics fragment factory for creating metrics data fragments."""
 
-from typing import List, Dict, Any
+from itertools import accumulate, chain, islice
+from typing import Any, Iterable, Iterator
 from domain import Factory, FactoryDecorator
 from ..spreadsheet_fragment import SpreadsheetFragment
+from ..monthly_table import MonthlyTable
 from ..formatted_spreadsheet_fragment import FormattedSpreadsheetFragment, CellFormat, RangeFormat
 
 
+# Shared metrics formats
+_BOLD_FMT = CellFormat(bold=True)
+_NUMBER_FMT = CellFormat(number_format="#,##0", horizontal_align="right")
+
+
+def _iter_row(label: str, values: Iterable[Any]) -> Iterator[Any]:
+    """Yield a metric row: label followed by each value padded to three cells.
+    
+    Args:
+        label: Metric name for the first column
+        values: Numeric value per month (displayed through the number format)
+        
+    Yields:
+        Row cells, consumed once by SpreadsheetFragment.with_rows
+    """
+    yield label
+    yield from chain.from_iterable((value, '', '') for value in values)
+
+
 class MonthlyMetricsFragmentFactory(FactoryDecorator):
     """Factory decorator for creating monthly metrics fragments.
     
@@ -25,82 +46,67 @@ class MonthlyMetricsFragmentFactory(FactoryDecorator):
         
         Args:
             **kwargs: Must include:
-                - monthly_data: Dictionary with month keys and metric values
-                - months: Sorted list of month keys
+                - monthly_table: MonthlyTable with the metric columns per month
+                  (or monthly_data and months, as in earlier callers)
                 - channel: Optional Channel object with initial subscriber count
             
         Returns:
             Formatted SpreadsheetFragment with metrics data
         """
-        monthly_data = kwargs.get('monthly_data', {})
-        months = kwargs.get('months', [])
+        monthly_table = MonthlyTable.from_kwargs(kwargs)
         channel = kwargs.get('channel')
         
         # Use the wrapped factory to create base fragment
         fragment = self.factory.create()
         
+        # Metric columns come pre-transposed from the table
+        views_col = monthly_table.column('views', 0)
+        minutes_col = monthly_table.column('watch_time_minutes', 0)
+        gained_col = monthly_table.column('subscribers_gained', 0)
+        lost_col = monthly_table.column('subscribers_lost', 0)
+        
+        net_col = [gained - lost for gained, lost in zip(gained_col, lost_col)]
+        
+        # Running subscriber total, starting from the channel's count if available
+        initial_subs = channel.subscriber_count if channel else 0
+        cumulative_col = islice(accumulate(net_col, initial=initial_subs), 1, None)
+        
+        # Collect lazy rows and materialize them once in with_rows. Values stay
+        # numeric: they are written RAW and displayed through _NUMBER_FMT
+        rows = []
+        
         # Views row
-        row_views = ['Просмотры']
-        for month_key in months:
-            views = monthly_data.get(month_key, {}).get('views', 0)
-            row_views.extend([str(views), '', ''])
-        fragment = fragment.with_row(row_views)
+        rows.append(_iter_row('Просмотры', views_col))
         
         # Watch time row
-        row_watch = ['Время просмотра (часы)']
-        for month_key in months:
-            minutes = monthly_data.get(month_key, {}).get('watch_time_minutes', 0)
-            hours = round(minutes / 60, 1)
-            row_watch.extend([str(hours), '', ''])
-        fragment = fragment.with_row(row_watch)
+        rows.append(_iter_row(
+            'Время просмотра (часы)',
+            (round(minutes / 60, 1) for minutes in minutes_col)
+        ))
         
         # Subscribers gained row
-        row_gained = ['Новые подписчики']
-        for month_key in months:
-            gained = monthly_data.get(month_key, {}).get('subscribers_gained', 0)
-            row_gained.extend([str(gained), '', ''])
-        fragment = fragment.with_row(row_gained)
+        rows.append(_iter_row('Новые подписчики', gained_col))
         
         # Subscribers lost row
-        row_lost = ['Потерянные подписчики']
-        for month_key in months:
-            lost = monthly_data.get(month_key, {}).get('subscribers_lost', 0)
-            row_lost.extend([str(lost), '', ''])
-        fragment = fragment.with_row(row_lost)
+        rows.append(_iter_row('Потерянные подписчики', lost_col))
         
         # Net change row
-        row_net = ['Чистый прирост']
-        for month_key in months:
-            gained = monthly_data.get(month_key, {}).get('subscribers_gained', 0)
-            lost = monthly_data.get(month_key, {}).get('subscribers_lost', 0)
-            net = gained - lost
-            row_net.extend([f"{net:+d}" if net != 0 else "0", '', ''])
-        fragment = fragment.with_row(row_net)
-        
-        # Total subscribers row - calculate cumulative total
-        row_total_subs = ['Количество подписчиков']
-        # Start with initial subscriber count from channel if available
-        cumulative_subs = channel.subscriber_count if channel else 0
-        for month_key in months:
-            gained = monthly_data.get(month_key, {}).get('subscribers_gained', 0)
-            lost = monthly_data.get(month_key, {}).get('subscribers_lost', 0)
-            cumulative_subs += (gained - lost)
-            row_total_subs.extend([str(cumulative_subs), '', ''])
-        fragment = fragment.with_row(row_total_subs)
+        rows.append(_iter_row('Чистый прирост', net_col))
+        
+        # Total subscribers row
+        rows.append(_iter_row('Количество подписчиков', cumulative_col))
+        fragment = fragment.with_rows(rows)
         
         # Apply metrics formatting
         formats = []
         
         # Bold first column (metric names)
         num_rows = len(fragment.rows)
-        formats.append(RangeFormat(0, 0, num_rows - 1, 0, CellFormat(bold=True)))
-        
-        # Number format for data columns
-        num_cols = max(len(row) for row in fragment.rows) if fragment.rows else 0
-        for col in range(1, num_cols):
-            formats.append(RangeFormat(0, col, num_rows - 1, col, CellFormat(
-                number_format="#,##0",
-                horizontal_align="right"
-            )))
+        formats.append(RangeFormat(0, 0, num_rows - 1, 0, _BOLD_FMT))
+        
+        # Number format for all data columns as one range
+        num_cols = fragment.num_cols
+        if num_cols > 1:
+            formats.append(RangeFormat(0, 1, num_rows - 1, num_cols - 1, _NUMBER_FMT))
         
         return FormattedSpreadsheetFragment(fragment, formats)
\ No newline at end of file
@@ -1,10 +1,14 @@
 """Section header fragment factory for creating section header fragments."""
 
 from domain import Factory, FactoryDecorator
-from ..spreadsheet_fragment import SpreadsheetFragment
+from ..spreadsheet_fragment import SpreadsheetFragment, EMPTY_MONTH_BLOCK
 from ..formatted_spreadsheet_fragment import FormattedSpreadsheetFragment, CellFormat, RangeFormat
 
 
+# Shared section header format
+_SECTION_FMT = CellFormat(bold=True, font_size=11, background_color="#F5F5F5")
+
+
 class SectionHeaderFragmentFactory(FactoryDecorator):
     """Factory decorator for creating section header fragments.
     
@@ -35,7 +39,8 @@ class SectionHeaderFragmentFactory(FactoryDecorator):
         
         # Use the wrapped factory to create base fragment
         fragment = self.factory.create()
-        row = [title] + ['', '', ''] * num_months
+        row = [title]
+        row.extend(EMPTY_MONTH_BLOCK * num_months)
         fragment = fragment.with_row(row)
         
         # Apply section header formatting
@@ -43,11 +48,7 @@ class SectionHeaderFragmentFactory(FactoryDecorator):
         
         # Bold and background color for section headers
         if fragment.rows:
-            num_cols = max(len(row) for row in fragment.rows) if fragment.rows else 0
-            formats.append(RangeFormat(0, 0, 0, num_cols - 1, CellFormat(
-                bold=True,
-                font_size=11,
-                background_color="#F5F5F5"
-            )))
+            num_cols = fragment.num_cols
+            formats.append(RangeFormat(0, 0, 0, num_cols - 1, _SECTION_FMT))
         
         return FormattedSpreadsheetFragment(fragment, formats)
\ No newline at end of file
@@ -10,6 +10,9 @@ class SpreadsheetFragmentFactory(Factory):
     This serves as the base factory that fragment decorators can wrap.
     """
     
+    # Fragments are immutable, so every chain can start from the same empty one
+    _EMPTY = SpreadsheetFragment()
+    
     def create(self, **kwargs) -> SpreadsheetFragment:
         """Create an empty spreadsheet fragment.
         
@@ -17,6 +20,6 @@ class SpreadsheetFragmentFactory(Factory):
             **kwargs: Optional initialization parameters
             
         Returns:
-            Empty SpreadsheetFragment instance
+            Shared empty SpreadsheetFragment instance
         """
-        return SpreadsheetFragment()
\ No newline at end of file
+        return self._EMPTY
\ No newline at end of file
@@ -40,9 +40,10 @@ class SubscriberTotalFragmentFactory(FactoryDecorator):
         # Use the wrapped factory to create base fragment
         fragment = self.factory.create()
         
+        # This would need cumulative calculation in real implementation;
+        # for now the same total is repeated in every month block
+        block = (str(channel.subscriber_count), '', '')
         row = ['Всего подписчиков']
-        for _ in months:
-            # This would need cumulative calculation in real implementation
-            row.extend([str(channel.subscriber_count), '', ''])
+        row.extend(block * len(months))
         
         return fragment.with_row(row)
\ No newline at end of file
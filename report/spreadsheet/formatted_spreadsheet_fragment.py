@@ -1,13 +1,23 @@
 """FormattedSpreadsheetFragment - Decorator for applying formatting to SpreadsheetFragments."""
 
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+import sys
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Iterable
+from dataclasses import dataclass, field
 from .spreadsheet_fragment import SpreadsheetFragment
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; on 3.9 the classes keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CellFormat:
-    """Formatting properties for spreadsheet cells."""
+    """Formatting properties for spreadsheet cells.
+    
+    Immutable and hashable, so a single instance can be shared across fragments;
+    its Google Sheets representation is built once, when the format is created.
+    """
     bold: Optional[bool] = None
     italic: Optional[bool] = None
     font_size: Optional[int] = None
@@ -17,10 +27,40 @@ class CellFormat:
     horizontal_align: Optional[str] = None  # "left", "center", "right"
     vertical_align: Optional[str] = None  # "top", "middle", "bottom"
     number_format: Optional[str] = None  # e.g., "#,##0", "0.00%"
-    borders: Optional[Dict[str, bool]] = None  # {"top": True, "bottom": True, etc.}
+    # (side, enabled) pairs like (("top", True), ("bottom", True)); a dict such
+    # as {"top": True} is also accepted and converted
+    borders: Optional[Tuple[Tuple[str, bool], ...]] = None
+    # The 'cell' part of a repeatCell request, built in __post_init__; not part
+    # of the format's identity
+    _sheets_cell: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Normalize borders and build the Google Sheets representation.
+        
+        Borders given as a dict are stored as (side, enabled) pairs to keep the
+        format hashable.
+        """
+        if isinstance(self.borders, dict):
+            object.__setattr__(self, 'borders', tuple(self.borders.items()))
+        object.__setattr__(self, '_sheets_cell', {'userEnteredFormat': self._build_google_sheets_format()})
     
     def to_google_sheets_format(self) -> Dict[str, Any]:
-        """Convert to Google Sheets API format."""
+        """Convert to Google Sheets API format.
+        
+        The dict is built once per format and shared between callers, so it
+        must be treated as read-only.
+        """
+        return self._sheets_cell['userEnteredFormat']
+    
+    def to_google_sheets_cell(self) -> Dict[str, Any]:
+        """Get the shared 'cell' part of a repeatCell request for this format.
+        
+        Shared like to_google_sheets_format(); treat the result as read-only.
+        """
+        return self._sheets_cell
+    
+    def _build_google_sheets_format(self) -> Dict[str, Any]:
+        """Build the Google Sheets API format dict from the fields."""
         format_dict = {}
         
         text_format = {}
@@ -52,7 +92,7 @@ class CellFormat:
         
         if self.borders:
             borders = {}
-            for side, enabled in self.borders.items():
+            for side, enabled in self.borders:
                 if enabled:
                     borders[side] = {'style': 'SOLID'}
             if borders:
@@ -61,8 +101,9 @@ class CellFormat:
         return format_dict
     
     @staticmethod
+    @lru_cache(maxsize=64)
     def _hex_to_rgb(hex_color: str) -> Dict[str, float]:
-        """Convert hex color to RGB dict for Google Sheets."""
+        """Convert hex color to RGB dict for Google Sheets (cached per color)."""
         hex_color = hex_color.lstrip('#')
         return {
             'red': int(hex_color[0:2], 16) / 255,
@@ -71,7 +112,7 @@ class CellFormat:
         }
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class RangeFormat:
     """Formatting for a specific range of cells."""
     start_row: int
@@ -80,32 +121,91 @@ class RangeFormat:
     end_col: int
     format: CellFormat
     
-    def to_google_sheets_request(self, sheet_id: int = 0) -> Dict[str, Any]:
-        """Create a Google Sheets format request."""
+    def to_google_sheets_request(self, sheet_id: int = 0, row_offset: int = 0,
+                                 col_offset: int = 0) -> Dict[str, Any]:
+        """Create a Google Sheets format request.
+        
+        Args:
+            sheet_id: Target worksheet id
+            row_offset: Rows to shift the range down by (set when fragments are merged)
+            col_offset: Columns to shift the range right by
+        """
         return {
             'repeatCell': {
                 'range': {
                     'sheetId': sheet_id,
-                    'startRowIndex': self.start_row,
-                    'endRowIndex': self.end_row + 1,
-                    'startColumnIndex': self.start_col,
-                    'endColumnIndex': self.end_col + 1
-                },
-                'cell': {
-                    'userEnteredFormat': self.format.to_google_sheets_format()
+                    'startRowIndex': self.start_row + row_offset,
+                    'endRowIndex': self.end_row + row_offset + 1,
+                    'startColumnIndex': self.start_col + col_offset,
+                    'endColumnIndex': self.end_col + col_offset + 1
                 },
+                'cell': self.format.to_google_sheets_cell(),
                 'fields': 'userEnteredFormat'
             }
         }
 
 
+# A range format together with the row offset at which its fragment was placed
+PlacedFormat = Tuple[RangeFormat, int]
+
+
+def coalesce_range_formats(placements: Iterable[PlacedFormat]) -> List[PlacedFormat]:
+    """Merge ranges that apply the same format to the same columns.
+    
+    Each repeatCell request replaces the whole userEnteredFormat of its cells,
+    so request order decides the result where ranges overlap. A range is only
+    folded into an earlier one with the same format and columns when their rows
+    touch or overlap and no request issued in between covers any of its cells;
+    the resulting cell formatting is therefore identical to the input's.
+    
+    Args:
+        placements: (range format, row offset) pairs in the order they would be applied
+        
+    Returns:
+        New list with the same effect and at most as many entries
+    """
+    coalesced: List[PlacedFormat] = []
+    # Absolute (start_row, end_row) of each coalesced entry
+    spans: List[Tuple[int, int]] = []
+    for fmt, offset in placements:
+        start_row = fmt.start_row + offset
+        end_row = fmt.end_row + offset
+        for index in range(len(coalesced) - 1, -1, -1):
+            candidate = coalesced[index][0]
+            candidate_start, candidate_end = spans[index]
+            same_columns = candidate.start_col == fmt.start_col and candidate.end_col == fmt.end_col
+            if (same_columns and candidate.format == fmt.format and
+                    start_row <= candidate_end + 1 and candidate_start <= end_row + 1):
+                merged_span = (min(candidate_start, start_row), max(candidate_end, end_row))
+                coalesced[index] = (
+                    RangeFormat(merged_span[0], fmt.start_col, merged_span[1], fmt.end_col, fmt.format),
+                    0
+                )
+                spans[index] = merged_span
+                break
+            if (start_row <= candidate_end and candidate_start <= end_row and
+                    fmt.start_col <= candidate.end_col and candidate.start_col <= fmt.end_col):
+                # A later request already covers these cells; keep the order
+                coalesced.append((fmt, offset))
+                spans.append((start_row, end_row))
+                break
+        else:
+            coalesced.append((fmt, offset))
+            spans.append((start_row, end_row))
+    return coalesced
+
+
 class FormattedSpreadsheetFragment(SpreadsheetFragment):
     """Decorator that adds formatting information to a SpreadsheetFragment.
     
     This maintains the immutable nature of SpreadsheetFragment while
-    tracking formatting that should be applied when exported.
+    tracking formatting that should be applied when exported. Formats are
+    kept as (RangeFormat, row offset) placements so merging fragments only
+    records where a format landed instead of rebuilding it.
     """
     
+    __slots__ = ('placements',)
+    
     def __init__(self, fragment: SpreadsheetFragment, formats: Optional[List[RangeFormat]] = None):
         """Initialize with a fragment and optional formatting.
         
@@ -113,20 +213,71 @@ class FormattedSpreadsheetFragment(SpreadsheetFragment):
             fragment: The SpreadsheetFragment to decorate
             formats: List of RangeFormat objects to apply
         """
-        super().__init__(fragment.rows)
-        self.formats = formats or []
+        super().__init__(fragment.rows, _num_cols=fragment.num_cols, _trusted=True)
+        self.placements = [(fmt, 0) for fmt in formats or ()]
+    
+    @classmethod
+    def from_placements(cls, fragment: SpreadsheetFragment,
+                        placements: List[PlacedFormat]) -> 'FormattedSpreadsheetFragment':
+        """Decorate a fragment with already placed (format, row offset) pairs.
+        
+        Args:
+            fragment: The SpreadsheetFragment to decorate
+            placements: Range formats with the row offsets to apply them at
+            
+        Returns:
+            New FormattedSpreadsheetFragment
+        """
+        formatted = object.__new__(cls)
+        SpreadsheetFragment.__init__(formatted, fragment.rows, _num_cols=fragment.num_cols, _trusted=True)
+        formatted.placements = placements
+        return formatted
     
+    @property
+    def formats(self) -> List[RangeFormat]:
+        """Range formats in absolute fragment coordinates, materialized on demand."""
+        return [
+            fmt if not offset else RangeFormat(
+                fmt.start_row + offset, fmt.start_col, fmt.end_row + offset, fmt.end_col, fmt.format
+            )
+            for fmt, offset in self.placements
+        ]
     
     # Override parent methods to maintain immutability
     def with_row(self, row: List[Any]) -> 'FormattedSpreadsheetFragment':
         """Add a row, preserving formats."""
-        new_fragment = SpreadsheetFragment(self.rows).with_row(row)
-        return FormattedSpreadsheetFragment(new_fragment, self.formats)
+        if not isinstance(row, (list, tuple)):
+            raise ValueError(f"Row must be a list or tuple, got {type(row)}")
+        return self._with_new_rows(self.rows + (tuple(row),), max(self._num_cols, len(row)))
     
-    def with_rows(self, rows: List[List[Any]]) -> 'FormattedSpreadsheetFragment':
+    def with_rows(self, rows: Iterable[Iterable[Any]]) -> 'FormattedSpreadsheetFragment':
         """Add rows, preserving formats."""
-        new_fragment = SpreadsheetFragment(self.rows).with_rows(rows)
-        return FormattedSpreadsheetFragment(new_fragment, self.formats)
+        added_rows = tuple(tuple(row) for row in rows)
+        num_cols = max(self._num_cols, max(map(len, added_rows), default=0))
+        return self._with_new_rows(self.rows + added_rows, num_cols)
+    
+    def _with_new_rows(self, rows: Tuple[Tuple[Any, ...], ...], num_cols: int) -> 'FormattedSpreadsheetFragment':
+        """Build a sibling fragment directly, without an intermediate SpreadsheetFragment."""
+        fragment = object.__new__(FormattedSpreadsheetFragment)
+        SpreadsheetFragment.__init__(fragment, rows, _num_cols=num_cols, _trusted=True)
+        fragment.placements = self.placements
+        return fragment
+    
+    def collect_formats(self, sheet_id: int = 0) -> List[Dict[str, Any]]:
+        """Flatten all formats into coalesced Google Sheets requests.
+        
+        Row offsets from merging are applied here, while building the requests.
+        
+        Args:
+            sheet_id: Target worksheet id
+            
+        Returns:
+            List of repeatCell request dicts for a single batch_update
+        """
+        return [
+            fmt.to_google_sheets_request(sheet_id, row_offset=offset)
+            for fmt, offset in coalesce_range_formats(self.placements)
+        ]
     
     def update(self, worksheet, spreadsheet=None) -> None:
         """Update worksheet with fragment data and apply formatting.
@@ -138,9 +289,9 @@ class FormattedSpreadsheetFragment(SpreadsheetFragment):
         # First update the data using parent method
         super().update(worksheet, spreadsheet)
         
-        # Then apply formatting if spreadsheet is provided
-        if spreadsheet and self.formats:
-            format_requests = [fmt.to_google_sheets_request(worksheet.id) for fmt in self.formats]
+        # Then apply all formatting in one batch_update if spreadsheet is provided
+        if spreadsheet and self.placements:
+            format_requests = self.collect_formats(worksheet.id)
             if format_requests:
                 spreadsheet.batch_update({'requests': format_requests})
 
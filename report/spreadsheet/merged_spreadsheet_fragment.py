@@ -2,8 +2,14 @@
 
 from typing import List, Any, Tuple, Optional
 from abc import ABC, abstractmethod
+from itertools import zip_longest
 from .spreadsheet_fragment import SpreadsheetFragment
-from .formatted_spreadsheet_fragment import FormattedSpreadsheetFragment, RangeFormat
+from .formatted_spreadsheet_fragment import FormattedSpreadsheetFragment, coalesce_range_formats
+
+
+def _chunks(row: Tuple[Any, ...], size: int):
+    """Split a row into consecutive slices of the given size."""
+    return (row[i:i + size] for i in range(0, len(row), size))
 
 
 class MergedSpreadsheetFragment(SpreadsheetFragment, ABC):
@@ -37,17 +43,17 @@ class MergedSpreadsheetFragment(SpreadsheetFragment, ABC):
     # Override methods to maintain immutability
     def with_row(self, row: List[Any]) -> 'SpreadsheetFragment':
         """Add a row to the merged result."""
-        return SpreadsheetFragment(self.rows).with_row(row)
+        return SpreadsheetFragment(self.rows, _num_cols=self._num_cols, _trusted=True).with_row(row)
     
     def with_rows(self, rows: List[List[Any]]) -> 'SpreadsheetFragment':
         """Add rows to the merged result."""
-        return SpreadsheetFragment(self.rows).with_rows(rows)
+        return SpreadsheetFragment(self.rows, _num_cols=self._num_cols, _trusted=True).with_rows(rows)
 
 
 def VerticalMergedSpreadsheetFragment(left: SpreadsheetFragment, right: SpreadsheetFragment, gap_rows: int = 0) -> SpreadsheetFragment:
     """Merge fragments vertically (one below the other).
     
-    Returns a FormattedSpreadsheetFragment if either input is formatted,
+    Returns a FormattedSpreadsheetFragment if either input carries formats,
     otherwise returns a regular SpreadsheetFragment.
     
     Args:
@@ -58,54 +64,32 @@ def VerticalMergedSpreadsheetFragment(left: SpreadsheetFragment, right: Spreadsh
     Returns:
         Merged SpreadsheetFragment (may be formatted)
     """
-    # Merge rows
-    merged = left.to_list()
+    # Merge rows (rows are immutable tuples, so they are shared, not copied)
+    merged = list(left.rows)
+    num_cols = max(left.num_cols, right.num_cols)
     
     # Add gap rows if specified
     if gap_rows > 0:
-        # Determine column count for empty rows
-        num_cols = max(
-            max(len(row) for row in left.rows) if left.rows else 0,
-            max(len(row) for row in right.rows) if right.rows else 0
-        )
-        for _ in range(gap_rows):
-            merged.append([''] * num_cols)
+        merged.extend([('',) * num_cols] * gap_rows)
     
     # Add right fragment rows
-    merged.extend(right.to_list())
+    merged.extend(right.rows)
+    merged = SpreadsheetFragment(tuple(merged), _num_cols=num_cols, _trusted=True)
+    
+    # Merge format placements. Every fragment exposes them (empty for plain
+    # ones); left formats stay put, right ones only get a larger row offset.
+    gap_adjustment = len(left.rows) + gap_rows
+    merged_placements = list(left.placements)
+    merged_placements.extend((fmt, offset + gap_adjustment) for fmt, offset in right.placements)
+    
+    if merged_placements:
+        # Fuse ranges repeated across both sides (e.g. the bold first column)
+        return FormattedSpreadsheetFragment.from_placements(
+            merged, coalesce_range_formats(merged_placements)
+        )
     
-    # Check if we need formatting
-    left_has_formats = isinstance(left, FormattedSpreadsheetFragment)
-    right_has_formats = isinstance(right, FormattedSpreadsheetFragment)
-    
-    if left_has_formats or right_has_formats:
-        # Merge formats with adjusted indices
-        merged_formats = []
-        
-        # Add left fragment formats (no adjustment needed)
-        if left_has_formats and hasattr(left, 'formats'):
-            merged_formats.extend(left.formats)
-        
-        # Add right fragment formats (adjust row indices)
-        if right_has_formats and hasattr(right, 'formats'):
-            left_rows = len(left.rows)
-            gap_adjustment = left_rows + gap_rows
-            
-            for fmt in right.formats:
-                adjusted_format = RangeFormat(
-                    start_row=fmt.start_row + gap_adjustment,
-                    start_col=fmt.start_col,
-                    end_row=fmt.end_row + gap_adjustment,
-                    end_col=fmt.end_col,
-                    format=fmt.format
-                )
-                merged_formats.append(adjusted_format)
-        
-        # Return a FormattedSpreadsheetFragment
-        return FormattedSpreadsheetFragment(SpreadsheetFragment(merged), merged_formats)
-    else:
-        # Return regular SpreadsheetFragment
-        return SpreadsheetFragment(merged)
+    # Return regular SpreadsheetFragment
+    return merged
     
 
 
@@ -125,36 +109,21 @@ class HorizontalMergedSpreadsheetFragment(MergedSpreadsheetFragment):
     
     def _merge_fragments(self) -> List[List[Any]]:
         """Place fragments side by side with optional gap."""
-        left_rows = self.left.to_list()
-        right_rows = self.right.to_list()
+        left_cols = self.left.num_cols
         
-        # Determine dimensions
-        max_rows = max(len(left_rows), len(right_rows))
-        left_cols = max(len(row) for row in left_rows) if left_rows else 0
-        right_cols = max(len(row) for row in right_rows) if right_rows else 0
+        # Blank cells are sliced from shared tuples instead of built per row
+        left_padding = ('',) * left_cols
+        gap = ('',) * self.gap_cols
+        right_padding = ('',) * self.right.num_cols
         
         merged = []
-        for i in range(max_rows):
-            row = []
-            
-            # Add left fragment cells
-            if i < len(left_rows):
-                row.extend(left_rows[i])
+        for left_row, right_row in zip_longest(self.left.rows, self.right.rows):
+            if left_row is None:
+                left_row = left_padding
+            elif len(left_row) < left_cols:
                 # Pad to consistent width
-                row.extend([''] * (left_cols - len(left_rows[i])))
-            else:
-                row.extend([''] * left_cols)
-            
-            # Add gap columns
-            row.extend([''] * self.gap_cols)
-            
-            # Add right fragment cells
-            if i < len(right_rows):
-                row.extend(right_rows[i])
-            else:
-                row.extend([''] * right_cols)
-            
-            merged.append(row)
+                left_row = left_row + left_padding[len(left_row):]
+            merged.append(left_row + gap + (right_padding if right_row is None else right_row))
         
         return merged
 
@@ -182,37 +151,30 @@ class ColumnMergedSpreadsheetFragment(MergedSpreadsheetFragment):
     
     def _merge_fragments(self) -> List[List[Any]]:
         """Interleave columns from both fragments."""
-        left_rows = self.left.to_list()
-        right_rows = self.right.to_list()
+        left_rows = self.left.rows
+        right_rows = self.right.rows
         
         # Must have same number of rows
         if len(left_rows) != len(right_rows):
             raise ValueError(f"Column merge requires same row count: {len(left_rows)} != {len(right_rows)}")
         
+        left_cols = self.left_cols
+        right_cols = self.right_cols
+        left_padding = ('',) * left_cols
+        right_padding = ('',) * right_cols
+        
         merged = []
         for left_row, right_row in zip(left_rows, right_rows):
             merged_row = []
             
-            # Interleave columns
-            left_idx = 0
-            right_idx = 0
-            
-            while left_idx < len(left_row) or right_idx < len(right_row):
-                # Take from left
-                for _ in range(self.left_cols):
-                    if left_idx < len(left_row):
-                        merged_row.append(left_row[left_idx])
-                        left_idx += 1
-                    else:
-                        merged_row.append('')
-                
-                # Take from right
-                for _ in range(self.right_cols):
-                    if right_idx < len(right_row):
-                        merged_row.append(right_row[right_idx])
-                        right_idx += 1
-                    else:
-                        merged_row.append('')
+            # Interleave column groups, padding short or missing groups with blanks
+            for left_chunk, right_chunk in zip_longest(
+                _chunks(left_row, left_cols), _chunks(right_row, right_cols), fillvalue=()
+            ):
+                merged_row.extend(left_chunk)
+                merged_row.extend(left_padding[len(left_chunk):])
+                merged_row.extend(right_chunk)
+                merged_row.extend(right_padding[len(right_chunk):])
             
             merged.append(merged_row)
         
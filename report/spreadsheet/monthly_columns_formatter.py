@@ -1,11 +1,26 @@
 """Monthly columns formatter for analytics reports."""
 
+import sys
+from functools import lru_cache
 from domain import YouTubeMetrics
-from typing import Optional, List, Dict, Any
+from typing import Optional, List
 from domain import Factory
 from ..google_sheets_report import GoogleSheetsReport
-from .merged_spreadsheet_fragment import VerticalMergedSpreadsheetFragment
 from .spreadsheet_fragment import SpreadsheetFragment
+from .monthly_table import MonthlyTable
+
+
+@lru_cache(maxsize=64)
+def _empty_row(width: int) -> SpreadsheetFragment:
+    """Single blank row of the given width, shared by every export of that width.
+    
+    Args:
+        width: Number of cells
+        
+    Returns:
+        Immutable one-row SpreadsheetFragment
+    """
+    return SpreadsheetFragment((('',) * width,), _trusted=True)
 
 
 class MonthlyColumnsFormatter(GoogleSheetsReport):
@@ -16,8 +31,8 @@ class MonthlyColumnsFormatter(GoogleSheetsReport):
     - Metrics as rows
     """
     
-    # Russian month names
-    MONTH_NAMES_RU = {
+    # Russian month names, interned so lookups and formatted headers share one object per name
+    MONTH_NAMES_RU = {month: sys.intern(name) for month, name in {
         1: 'янв',
         2: 'февр',
         3: 'мар',
@@ -30,12 +45,12 @@ class MonthlyColumnsFormatter(GoogleSheetsReport):
         10: 'окт',
         11: 'нояб',
         12: 'дек'
-    }
+    }.items()}
     
     def __init__(
         self,
         report: YouTubeMetrics,
-        monthly_data: Dict[str, Dict[str, Any]],
+        monthly_table: MonthlyTable,
         header_factory: Factory,
         channel_factory: Factory,
         metrics_factory: Factory,
@@ -51,7 +66,7 @@ class MonthlyColumnsFormatter(GoogleSheetsReport):
         
         Args:
             report: YouTubeMetrics instance
-            monthly_data: Pre-aggregated monthly metrics from MonthlyModelFactory
+            monthly_table: Pre-aggregated monthly metrics transposed into columns
             header_factory: Factory for creating header fragments
             channel_factory: Factory for creating channel fragments
             metrics_factory: Factory for creating metrics fragments
@@ -70,7 +85,7 @@ class MonthlyColumnsFormatter(GoogleSheetsReport):
             share_emails=share_emails
         )
         self.report = report
-        self.monthly_data = monthly_data
+        self.monthly_table = monthly_table
         self.header_factory = header_factory
         self.channel_factory = channel_factory
         self.metrics_factory = metrics_factory
@@ -79,8 +94,10 @@ class MonthlyColumnsFormatter(GoogleSheetsReport):
         self.geographic_factory = geographic_factory
         self.sheet_name = sheet_name or 'Analytics'
     
-    def _format_month_header(self, year: int, month: int) -> str:
-        """Format month header in Russian.
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _format_month_header(cls, year: int, month: int) -> str:
+        """Format month header in Russian (cached per year and month).
         
         Args:
             year: Year number
@@ -89,7 +106,7 @@ class MonthlyColumnsFormatter(GoogleSheetsReport):
         Returns:
             Formatted month string like "янв. 2025"
         """
-        month_name = self.MONTH_NAMES_RU.get(month, str(month))
+        month_name = cls.MONTH_NAMES_RU.get(month, str(month))
         return f"{month_name}. {year}"
     
     def _create_monthly_columns_data(self) -> SpreadsheetFragment:
@@ -98,29 +115,32 @@ class MonthlyColumnsFormatter(GoogleSheetsReport):
         Returns:
             SpreadsheetFragment containing the YouTube sheet structure
         """
-        months = sorted(self.monthly_data.keys())
+        months = self.monthly_table.months
         
         if not months:
             return SpreadsheetFragment()
         
+        # Render the month axis once for every factory that needs it
+        month_headers = tuple(
+            self._format_month_header(*map(int, month_key.split('-'))) for month_key in months
+        )
+        
         # Create individual fragments using passed factories
-        header_fragment = self.header_factory.create(months=months, month_names_ru=self.MONTH_NAMES_RU)
+        header_fragment = self.header_factory.create(months=months, month_headers=month_headers)
         channel_fragment = self.channel_factory.create(
             channel=self.report.channel, 
-            months=months,
-            monthly_data=self.monthly_data
+            monthly_table=self.monthly_table
         )
         
         # Empty row between sections
-        empty_row = SpreadsheetFragment().with_row([''] * (1 + 3 * len(months)))
+        empty_row = _empty_row(1 + 3 * len(months))
         
         # Metrics section header
         metrics_header = self.section_factory.create(title='Метрики', num_months=len(months))
         
         # Monthly metrics
         metrics_fragment = self.metrics_factory.create(
-            monthly_data=self.monthly_data, 
-            months=months,
+            monthly_table=self.monthly_table,
             channel=self.report.channel
         )
         
@@ -129,25 +149,21 @@ class MonthlyColumnsFormatter(GoogleSheetsReport):
         
         # Optional geographic data
         if self.geographic_factory:
-            geographic_fragment = self.geographic_factory.create(monthly_data=self.monthly_data, months=months)
+            geographic_fragment = self.geographic_factory.create(monthly_table=self.monthly_table)
         else:
             geographic_fragment = None
         
-        # Merge all fragments vertically
-        result = header_fragment
-        result = VerticalMergedSpreadsheetFragment(result, channel_fragment)
-        result = VerticalMergedSpreadsheetFragment(result, empty_row)
-        result = VerticalMergedSpreadsheetFragment(result, metrics_header)
-        result = VerticalMergedSpreadsheetFragment(result, metrics_fragment)
+        # Collect the sections in display order and stack them in one pass
+        parts = [header_fragment, channel_fragment, empty_row, metrics_header, metrics_fragment]
         
         if subscriber_total.rows:
-            result = VerticalMergedSpreadsheetFragment(result, subscriber_total)
+            parts.append(subscriber_total)
         
         if geographic_fragment and geographic_fragment.rows:
-            result = VerticalMergedSpreadsheetFragment(result, empty_row)
-            result = VerticalMergedSpreadsheetFragment(result, geographic_fragment)
+            parts.append(empty_row)
+            parts.append(geographic_fragment)
         
-        return result
+        return SpreadsheetFragment.concat_vertical(*parts)
     
     def export(self) -> str:
         """Export YouTubeMetrics to Google Sheets in monthly columns format.
@@ -156,24 +172,41 @@ class MonthlyColumnsFormatter(GoogleSheetsReport):
             URL of the created/updated spreadsheet
         """
         try:
-            # Authenticate
-            self.client = self._authenticate()
-            
-            # Get or create spreadsheet
-            self.spreadsheet = self._get_or_create_spreadsheet()
+            # Authenticate unless this formatter already holds a client
+            if self.client is None:
+                self.client = self._authenticate()
             
-            # Create sheet with configured name
-            self.worksheet = self._get_or_create_worksheet()
+            # Get or create spreadsheet and the configured sheet (cached across exports)
+            self._open_sheet()
             
             # Prepare and write data with formatting
             sheet_fragment = self._create_monthly_columns_data()
             
-            # Use the fragment's update method to handle both data and formatting
-            sheet_fragment.update(self.worksheet, self.spreadsheet)
+            # Write all values in one values.batchUpdate and all formatting in
+            # one batchUpdate, instead of clear + update + format round-trips.
+            # Cells already hold typed values (numbers, fractions for percents)
+            # shown through explicit number formats, so they are sent RAW and
+            # the server does not parse them
+            value_ranges = sheet_fragment.collect_updates(sheet_name=self.worksheet.title)
+            format_requests = sheet_fragment.collect_formats(self.worksheet.id)
+            
+            # The two writes stay sequential: they share the client's session,
+            # and a failed values write must not leave formatting in flight
+            if value_ranges:
+                self._values_batch_update({
+                    'valueInputOption': 'RAW',
+                    'data': value_ranges
+                })
+            
+            if format_requests:
+                self.spreadsheet.batch_update({'requests': format_requests})
             
             return f"https://docs.google.com/spreadsheets/d/{self.spreadsheet.id}"
             
         except Exception as e:
+            # The cached handles may be stale (e.g. the tab was deleted)
+            self._forget_sheet()
+            
             if "Drive API" in str(e):
                 raise Exception(
                     "Google Drive API is required to create new spreadsheets. "
@@ -0,0 +1,129 @@
+"""On-disk cache for monthly aggregated metrics."""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from typing import Dict, Any, List, Optional
+
+
+class MonthlyDataCache:
+    """Stores MonthlyMetricsFactory results as JSON files keyed by an input hash.
+    
+    The monthly aggregation only depends on the daily metrics and the
+    per-month video counts and geographic tops, which rarely change between
+    exports of the same data to different sheets. The cache lets a repeat
+    export skip the aggregation entirely.
+    """
+    
+    DEFAULT_DIRECTORY = os.path.join(
+        os.path.expanduser('~'), '.cache', 'youtube-statistics', 'monthly'
+    )
+    
+    # Part of every key; bump it whenever the aggregation or the shape of its
+    # result changes, so entries written by older code are never read
+    VERSION = 1
+    
+    # Cache files kept; the least recently written beyond this are removed
+    DEFAULT_MAX_ENTRIES = 64
+    
+    def __init__(self, directory: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize the cache.
+        
+        Args:
+            directory: Directory for cache files (defaults to ~/.cache/youtube-statistics/monthly)
+            max_entries: Number of cache files kept after each write
+        """
+        self.directory = directory or self.DEFAULT_DIRECTORY
+        self.max_entries = max_entries
+    
+    @classmethod
+    def key_for(
+        cls,
+        daily_metrics: List[Any],
+        video_counts_by_month: Optional[Dict[str, int]] = None,
+        geographic_views_by_month: Optional[Dict[str, List]] = None,
+        geographic_subscribers_by_month: Optional[Dict[str, List]] = None
+    ) -> str:
+        """Hash the aggregation inputs into a cache key.
+        
+        Args:
+            daily_metrics: Daily metrics to aggregate
+            video_counts_by_month: Video counts per month
+            geographic_views_by_month: Top countries by views per month
+            geographic_subscribers_by_month: Top countries by subscribers per month
+        
+        Returns:
+            Hex digest identifying the inputs and the cache version
+        """
+        payload = pickle.dumps((
+            cls.VERSION,
+            tuple(daily_metrics or ()),
+            sorted((video_counts_by_month or {}).items()),
+            sorted((geographic_views_by_month or {}).items()),
+            sorted((geographic_subscribers_by_month or {}).items())
+        ), protocol=pickle.HIGHEST_PROTOCOL)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        """Get the cache file path for a key."""
+        return os.path.join(self.directory, f'{key}.json')
+    
+    def get(self, key: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load cached monthly data.
+        
+        Args:
+            key: Cache key from key_for
+        
+        Returns:
+            Monthly data, or None if it is not cached or unreadable
+        """
+        try:
+            # json detects the UTF-8 encoding itself, so skip the text layer
+            with open(self._path(key), 'rb') as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def put(self, key: str, monthly_data: Dict[str, Dict[str, Any]]) -> None:
+        """Store monthly data; the file is replaced atomically.
+        
+        Failing to write the cache is not an error for the export, so
+        problems are only reported.
+        
+        Args:
+            key: Cache key from key_for
+            monthly_data: Result of MonthlyMetricsFactory.create()
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(monthly_data, f, ensure_ascii=False)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._prune()
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: could not write monthly data cache: {e}")
+    
+    def _prune(self) -> None:
+        """Remove the oldest cache files beyond max_entries."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.json'):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+        
+        entries.sort(reverse=True)
+        for _, path in entries[self.max_entries:]:
+            try:
+                os.remove(path)
+            except OSError:
+                # Already removed by a concurrent export
+                pass
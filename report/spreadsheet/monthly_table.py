@@ -0,0 +1,81 @@
+"""MonthlyTable - Column-oriented view of pre-aggregated monthly metrics."""
+
+from typing import Dict, Any, Iterable, Optional, Tuple
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MonthlyTable:
+    """Monthly metrics stored as one tuple per metric along a sorted month axis.
+    
+    MonthlyMetricsFactory produces a dict of per-month dicts; every fragment
+    factory used to walk that structure month by month and look each metric
+    up again. The table transposes it once per export so factories read whole
+    columns instead.
+    """
+    
+    months: Tuple[str, ...]
+    columns: Dict[str, Tuple[Any, ...]]
+    
+    @classmethod
+    def from_monthly_data(cls,
+                          monthly_data: Dict[str, Dict[str, Any]],
+                          months: Optional[Iterable[str]] = None) -> 'MonthlyTable':
+        """Transpose monthly data into columns.
+        
+        Args:
+            monthly_data: Month keys (YYYY-MM) mapped to metric dicts
+            months: Optional month axis (defaults to the sorted keys of monthly_data)
+        
+        Returns:
+            MonthlyTable with None for metrics a month does not have
+        """
+        months = tuple(months) if months is not None else tuple(sorted(monthly_data))
+        entries = [monthly_data.get(month_key, {}) for month_key in months]
+        
+        # Union of metric names, in first-seen order
+        names: Dict[str, None] = {}
+        for entry in entries:
+            names.update(dict.fromkeys(entry))
+        
+        columns = {name: tuple(entry.get(name) for entry in entries) for name in names}
+        return cls(months, columns)
+    
+    @classmethod
+    def from_kwargs(cls, kwargs: Dict[str, Any]) -> 'MonthlyTable':
+        """Get the table passed to a fragment factory's create().
+        
+        Callers using the earlier signature pass monthly_data and months
+        instead; the table is then built from those.
+        
+        Args:
+            kwargs: Keyword arguments given to create()
+        
+        Returns:
+            MonthlyTable for the call
+        """
+        monthly_table = kwargs.get('monthly_table')
+        if monthly_table is not None:
+            return monthly_table
+        return cls.from_monthly_data(kwargs.get('monthly_data') or {}, kwargs.get('months', ()))
+    
+    def column(self, name: str, default: Any = None) -> Tuple[Any, ...]:
+        """Get the values of one metric for every month.
+        
+        Args:
+            name: Metric name (e.g. 'views')
+            default: Value used for months without the metric
+        
+        Returns:
+            Tuple aligned with months
+        """
+        values = self.columns.get(name)
+        if values is None:
+            return (default,) * len(self.months)
+        if default is None:
+            return values
+        return tuple(default if value is None else value for value in values)
+    
+    def __len__(self) -> int:
+        """Number of months in the table."""
+        return len(self.months)
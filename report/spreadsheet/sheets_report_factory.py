@@ -15,7 +15,8 @@ class SheetsReportFactory(Factory):
                  base_factory: Factory,
                  wrapper_class: Type,
                  spreadsheet_id: str,
-                 sheet_name: str = 'Sheet1'):
+                 sheet_name: str = 'Sheet1',
+                 use_cache: bool = True):
         """Initialize sheets report factory.
         
         Args:
@@ -23,11 +24,13 @@ class SheetsReportFactory(Factory):
             wrapper_class: The report wrapper class to use (e.g., YoutubeMetricsSheetsReport)
             spreadsheet_id: Google Sheets ID for export
             sheet_name: Name of the sheet to create/update
+            use_cache: Whether the wrapper may reuse on-disk cached data
         """
         self.base_factory = base_factory
         self.wrapper_class = wrapper_class
         self.spreadsheet_id = spreadsheet_id
         self.sheet_name = sheet_name
+        self.use_cache = use_cache
     
     def create(self, **kwargs) -> Any:
         """Create data and wrap it with sheets export capability.
@@ -45,5 +48,6 @@ class SheetsReportFactory(Factory):
         return self.wrapper_class(
             report=data,
             spreadsheet_id=self.spreadsheet_id,
-            sheet_name=self.sheet_name
+            sheet_name=self.sheet_name,
+            use_cache=self.use_cache
         )
\ No newline at end of file
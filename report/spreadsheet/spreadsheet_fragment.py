@@ -1,9 +1,29 @@
 """SpreadsheetFragment - An immutable type-safe representation of spreadsheet data."""
 
-from typing import List, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Optional, Union, Tuple, Iterable
 from dataclasses import dataclass
 
 
+# Three blank cells spanned by each month in the monthly columns layout
+EMPTY_MONTH_BLOCK = ('',) * 3
+
+
+def _column_letter(col: int) -> str:
+    """Convert a 1-based column number to A1 notation letters (1 -> A, 27 -> AA).
+    
+    Args:
+        col: 1-based column number
+        
+    Returns:
+        Column letters
+    """
+    letters = ''
+    while col > 0:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
 @dataclass(frozen=True)
 class SpreadsheetFragment:
     """Immutable representation of spreadsheet data with rows and columns.
@@ -14,13 +34,27 @@ class SpreadsheetFragment:
     
     rows: Tuple[Tuple[Any, ...], ...]
     
-    def __init__(self, rows: Optional[Union[List[List[Any]], Tuple[Tuple[Any, ...], ...]]] = None):
+    # Declared by hand: dataclass(slots=True) needs Python 3.10 and would not
+    # include the cached column count
+    __slots__ = ('rows', '_num_cols')
+    
+    # Plain fragments carry no formatting; FormattedSpreadsheetFragment overrides these
+    formats = ()
+    placements = ()
+    
+    def __init__(self, rows: Optional[Union[List[List[Any]], Tuple[Tuple[Any, ...], ...]]] = None,
+                 _num_cols: Optional[int] = None, *, _trusted: bool = False):
         """Initialize with optional rows data.
         
         Args:
             rows: Initial rows data, defaults to empty tuple
+            _num_cols: Width of the widest row when already known by the caller
+            _trusted: Internal fast path for callers that already pass a tuple
+                      of tuples, which is then stored without normalization
         """
-        if rows is None:
+        if _trusted:
+            rows_tuple = rows
+        elif rows is None:
             rows_tuple = tuple()
         elif isinstance(rows, tuple):
             # Ensure inner elements are also tuples
@@ -34,6 +68,16 @@ class SpreadsheetFragment:
         
         # Use object.__setattr__ since the class is frozen
         object.__setattr__(self, 'rows', rows_tuple)
+        
+        # Width is computed once here and then carried forward incrementally
+        if _num_cols is None:
+            _num_cols = max(map(len, rows_tuple), default=0)
+        object.__setattr__(self, '_num_cols', _num_cols)
+    
+    @property
+    def num_cols(self) -> int:
+        """Number of columns, i.e. the length of the widest row."""
+        return self._num_cols
     
     # ============= Core Methods (4) =============
     
@@ -49,28 +93,56 @@ class SpreadsheetFragment:
         if not isinstance(row, (list, tuple)):
             raise ValueError(f"Row must be a list or tuple, got {type(row)}")
         new_rows = self.rows + (tuple(row),)
-        return SpreadsheetFragment(new_rows)
+        return SpreadsheetFragment(new_rows, _num_cols=max(self._num_cols, len(row)), _trusted=True)
     
-    def with_rows(self, rows: Union[List[List[Any]], List[Tuple[Any, ...]]]) -> 'SpreadsheetFragment':
+    def with_rows(self, rows: Iterable[Iterable[Any]]) -> 'SpreadsheetFragment':
         """Create a new fragment with additional rows.
         
         Args:
-            rows: List of rows to add
+            rows: Rows to add; any iterable of iterables (e.g. generators),
+                  materialized exactly once into the stored tuples
             
         Returns:
             New SpreadsheetFragment with the added rows
         """
-        new_rows = self.rows + tuple(tuple(row) for row in rows)
-        return SpreadsheetFragment(new_rows)
+        added_rows = tuple(tuple(row) for row in rows)
+        num_cols = max(self._num_cols, max(map(len, added_rows), default=0))
+        return SpreadsheetFragment(self.rows + added_rows, _num_cols=num_cols, _trusted=True)
     
     def to_list(self) -> List[List[Any]]:
         """Convert to raw list format for API calls.
         
+        Kept for callers that need mutable rows; the API paths (update,
+        collect_updates) send the row tuples as they are, since tuples are
+        serialized to JSON arrays just like lists.
+        
         Returns:
             List of lists representing the spreadsheet data
         """
         return [list(row) for row in self.rows]
     
+    @classmethod
+    def concat_vertical(cls, *fragments: 'SpreadsheetFragment') -> 'SpreadsheetFragment':
+        """Stack fragments top to bottom in a single pass.
+        
+        Rows are appended to one list and frozen once, so stacking K fragments
+        costs O(total rows) instead of one nested merge per fragment.
+        
+        Args:
+            *fragments: Fragments in display order
+            
+        Returns:
+            FormattedSpreadsheetFragment if any fragment carries formats,
+            otherwise a plain SpreadsheetFragment
+        """
+        # Imported here: the builder module depends on this one
+        from .spreadsheet_fragment_builder import SpreadsheetFragmentBuilder
+        
+        builder = SpreadsheetFragmentBuilder()
+        for fragment in fragments:
+            builder.add_fragment(fragment)
+        return builder.build()
+    
     @classmethod
     def from_dict_list(cls, data: List[dict], columns: Optional[List[str]] = None) -> 'SpreadsheetFragment':
         """Create fragment from a list of dictionaries.
@@ -99,6 +171,49 @@ class SpreadsheetFragment:
         
         return cls(rows)
     
+    def collect_updates(self, offset_row: int = 0, offset_col: int = 0,
+                        sheet_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Describe the fragment's values as ValueRanges for spreadsheets.values.batchUpdate.
+        
+        Short rows are padded with blanks up to the fragment width, so writing
+        the range also clears stale cells inside it and no separate clear call
+        is needed.
+        
+        Args:
+            offset_row: 0-based row where the fragment starts on the sheet
+            offset_col: 0-based column where the fragment starts on the sheet
+            sheet_name: Worksheet title to qualify the A1 range with
+            
+        Returns:
+            List of {'range', 'values'} dicts (empty for an empty fragment)
+        """
+        num_cols = self._num_cols
+        if not self.rows or not num_cols:
+            return []
+        
+        a1_range = (
+            f"{_column_letter(offset_col + 1)}{offset_row + 1}:"
+            f"{_column_letter(offset_col + num_cols)}{offset_row + len(self.rows)}"
+        )
+        if sheet_name:
+            quoted_name = sheet_name.replace("'", "''")
+            a1_range = f"'{quoted_name}'!{a1_range}"
+        
+        padding = ('',) * num_cols
+        values = [row if len(row) == num_cols else row + padding[len(row):] for row in self.rows]
+        return [{'range': a1_range, 'values': values}]
+    
+    def collect_formats(self, sheet_id: int = 0) -> List[Dict[str, Any]]:
+        """Plain fragments have no formatting requests.
+        
+        Args:
+            sheet_id: Target worksheet id
+            
+        Returns:
+            Empty list
+        """
+        return []
+    
     def update(self, worksheet, spreadsheet=None) -> None:
         """Update worksheet with fragment data and apply any formatting.
         
@@ -106,25 +221,17 @@ class SpreadsheetFragment:
             worksheet: Google Sheets worksheet object
             spreadsheet: Google Sheets spreadsheet object (optional, for formatting)
         """
-        # Base implementation just updates the data
-        sheet_data = self.to_list()
+        # Base implementation just updates the data; the row tuples are passed
+        # through without copying them into lists
+        sheet_data = self.rows
         if sheet_data:
             # Calculate the range to clear based on data size
             num_rows = len(sheet_data)
-            num_cols = max(len(row) for row in sheet_data) if sheet_data else 0
+            num_cols = self._num_cols
             
             if num_rows > 0 and num_cols > 0:
                 # Clear the exact range we're about to write
-                # Handle column letters beyond Z
-                if num_cols <= 26:
-                    end_col = chr(65 + num_cols - 1)
-                else:
-                    # For columns beyond Z, use AA, AB, etc.
-                    first_letter = chr(65 + (num_cols - 1) // 26 - 1)
-                    second_letter = chr(65 + (num_cols - 1) % 26)
-                    end_col = first_letter + second_letter if num_cols > 26 else chr(65 + num_cols - 1)
-                
-                clear_range = f'A1:{end_col}{num_rows}'
+                clear_range = f'A1:{_column_letter(num_cols)}{num_rows}'
                 worksheet.batch_clear([clear_range])
                 
                 # Now write the new data
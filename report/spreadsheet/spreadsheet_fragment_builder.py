@@ -0,0 +1,72 @@
+"""SpreadsheetFragmentBuilder - Mutable accumulator that freezes into a SpreadsheetFragment."""
+
+from typing import List, Any, Iterable, Tuple
+from .spreadsheet_fragment import SpreadsheetFragment
+from .formatted_spreadsheet_fragment import (
+    FormattedSpreadsheetFragment,
+    PlacedFormat,
+    coalesce_range_formats
+)
+
+
+class SpreadsheetFragmentBuilder:
+    """Collects rows and fragments in a list and builds one immutable fragment.
+    
+    Appending through SpreadsheetFragment.with_row copies every existing row on
+    each call; the builder appends to a list instead and creates the frozen
+    fragment exactly once, keeping the formats of added fragments at the row
+    offset where they landed.
+    """
+    
+    __slots__ = ('_rows', '_num_cols', '_placements')
+    
+    def __init__(self):
+        """Initialize an empty builder."""
+        self._rows: List[Tuple[Any, ...]] = []
+        self._num_cols = 0
+        self._placements: List[PlacedFormat] = []
+    
+    def add_row(self, row: Iterable[Any]) -> 'SpreadsheetFragmentBuilder':
+        """Append a single row.
+        
+        Args:
+            row: Row cells
+        
+        Returns:
+            The builder, for chaining
+        """
+        row = tuple(row)
+        self._rows.append(row)
+        if len(row) > self._num_cols:
+            self._num_cols = len(row)
+        return self
+    
+    def add_fragment(self, fragment: SpreadsheetFragment) -> 'SpreadsheetFragmentBuilder':
+        """Append all rows of a fragment below the current ones, keeping its formats.
+        
+        Args:
+            fragment: Fragment to append
+        
+        Returns:
+            The builder, for chaining
+        """
+        offset = len(self._rows)
+        self._rows.extend(fragment.rows)
+        if fragment.num_cols > self._num_cols:
+            self._num_cols = fragment.num_cols
+        self._placements.extend((fmt, row_offset + offset) for fmt, row_offset in fragment.placements)
+        return self
+    
+    def build(self) -> SpreadsheetFragment:
+        """Freeze the collected rows into a fragment.
+        
+        Returns:
+            FormattedSpreadsheetFragment if any added fragment carried formats,
+            otherwise a plain SpreadsheetFragment
+        """
+        fragment = SpreadsheetFragment(tuple(self._rows), _num_cols=self._num_cols, _trusted=True)
+        if self._placements:
+            return FormattedSpreadsheetFragment.from_placements(
+                fragment, coalesce_range_formats(self._placements)
+            )
+        return fragment
@@ -4,9 +4,16 @@ from domain import SubscriptionMetrics
 from ..base import Report
 
 
+# Precompiled cell template (printf-style formatting skips f-string format-spec parsing)
+_FMT_PCT = "%.2f%%".__mod__
+
+
 class SubscriptionMetricsSheetsReport(Report):
     """Google Sheets exporter for SubscriptionMetrics model."""
     
+    # Trend labels indexed by the sign of the net change + 1
+    _TREND = ('📉 Declining', '➡️ Stable', '📈 Growing')
+    
     def __init__(self, subscription: SubscriptionMetrics):
         """Initialize with SubscriptionMetrics instance."""
         super().__init__(subscription)
@@ -29,15 +36,11 @@ class SubscriptionMetricsSheetsReport(Report):
             'Subscribers Gained': self.subscribers_gained,
             'Subscribers Lost': self.subscribers_lost,
             'Net Change': self.net_change,
-            'Growth Rate': f"{self.growth_rate:.2f}%"
+            'Growth Rate': _FMT_PCT(self.growth_rate)
         }
         
         # Add trend indicator
-        if self.net_change > 0:
-            result['Trend'] = '📈 Growing'
-        elif self.net_change < 0:
-            result['Trend'] = '📉 Declining'
-        else:
-            result['Trend'] = '➡️ Stable'
+        net_change = self.net_change
+        result['Trend'] = self._TREND[(net_change > 0) - (net_change < 0) + 1]
         
         return result
\ No newline at end of file
@@ -1,9 +1,15 @@
 """Google Sheets Exported wrapper for ViewsBreakdown model."""
 
+from functools import cached_property
+from operator import itemgetter
 from domain import ViewsBreakdown
 from ..base import Report
 
 
+# Precompiled cell template (printf-style formatting skips f-string format-spec parsing)
+_FMT_PCT = "%.1f%%".__mod__
+
+
 class ViewsBreakdownSheetsReport(Report):
     """Google Sheets exporter for ViewsBreakdown model."""
     
@@ -22,28 +28,26 @@ class ViewsBreakdownSheetsReport(Report):
             'Video Views': self.video_views,
             'Shorts Views': self.shorts_views,
             'Live Views': self.live_views,
-            'Video Percentage': f"{self.video_percentage:.1f}%",
-            'Shorts Percentage': f"{self.shorts_percentage:.1f}%",
-            'Live Percentage': f"{self.live_percentage:.1f}%",
-            'Most Popular Format': self._get_most_popular_format()
+            'Video Percentage': _FMT_PCT(self.video_percentage),
+            'Shorts Percentage': _FMT_PCT(self.shorts_percentage),
+            'Live Percentage': _FMT_PCT(self.live_percentage),
+            'Most Popular Format': self._most_popular_format
         }
     
-    def _get_most_popular_format(self) -> str:
-        """Determine the most popular content format.
+    @cached_property
+    def _most_popular_format(self) -> str:
+        """Determine the most popular content format (computed once per report).
         
         Returns:
             String indicating the most popular format
         """
-        formats = [
-            ('Videos', self.video_views),
-            ('Shorts', self.shorts_views),
-            ('Live', self.live_views)
-        ]
-        
-        # Sort by views and get the top one
-        formats.sort(key=lambda x: x[1], reverse=True)
+        # max keeps the first of equal counts, like the stable descending sort did
+        name, views = max(
+            (('Videos', self.video_views), ('Shorts', self.shorts_views), ('Live', self.live_views)),
+            key=itemgetter(1)
+        )
         
-        if formats[0][1] > 0:
-            return f"{formats[0][0]} ({formats[0][1]:,} views)"
+        if views > 0:
+            return f"{name} ({views:,} views)"
         else:
             return "No views yet"
\ No newline at end of file
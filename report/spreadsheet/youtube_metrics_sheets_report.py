@@ -1,10 +1,36 @@
 """Google Sheets Report wrapper for YouTubeMetrics model."""
 
+from functools import cached_property
+from operator import attrgetter
 from domain import YouTubeMetrics
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Iterable
 from ..google_sheets_report import GoogleSheetsReport
 
 
+def _forward(names: Iterable[str]):
+    """Class decorator adding read-only properties that forward to self.report.
+    
+    Forwarded names resolve through a class-level descriptor instead of a
+    failed lookup followed by __getattr__, which stays as the fallback for
+    every other attribute.
+    
+    Args:
+        names: Attribute names of the wrapped report to forward
+    """
+    def decorate(cls):
+        for name in names:
+            setattr(cls, name, property(attrgetter(f'report.{name}'), doc=f"Forwarded report.{name}."))
+        return cls
+    return decorate
+
+
+@_forward((
+    'channel',
+    'daily_metrics',
+    'video_counts_by_month',
+    'geographic_views_by_month',
+    'geographic_subscribers_by_month'
+))
 class YoutubeMetricsSheetsReport(GoogleSheetsReport):
     """Google Sheets exporter for YouTubeMetrics model.
     
@@ -17,7 +43,8 @@ class YoutubeMetricsSheetsReport(GoogleSheetsReport):
         spreadsheet_id: Optional[str] = None,
         sheet_name: Optional[str] = None,
         create_new: bool = False,
-        share_emails: Optional[List[str]] = None
+        share_emails: Optional[List[str]] = None,
+        use_cache: bool = True
     ):
         """Initialize with YouTubeMetrics instance.
         
@@ -27,53 +54,99 @@ class YoutubeMetricsSheetsReport(GoogleSheetsReport):
             sheet_name: Name for the sheet (defaults to 'Analytics')
             create_new: Whether to create a new spreadsheet
             share_emails: List of emails to share the spreadsheet with
+            use_cache: Whether to reuse monthly aggregations cached on disk
         """
         # Call parent with empty data - we'll handle export differently
         super().__init__(
             data={},
             spreadsheet_id=spreadsheet_id,
             create_new=create_new,
-            share_emails=share_emails
+            share_emails=share_emails,
+            use_cache=use_cache
         )
         self.report = report
         self.spreadsheet_id = spreadsheet_id
         self.sheet_name = sheet_name or 'Analytics'
-        
-        # Initialize all export components
-        self._initialize_export_components()
     
-    def _initialize_export_components(self):
-        """Initialize all export components in the constructor."""
-        # Import necessary components
+    # Export components are built on first use, so wrappers that are only
+    # used for attribute delegation never import or construct them
+    
+    @cached_property
+    def monthly_factory(self):
+        """Monthly aggregation factory over the report's daily metrics and video counts."""
         from domain import MonthlyMetricsFactory
-        from .factories import (
-            SpreadsheetFragmentFactory,
-            HeaderFragmentFactory,
-            ChannelFragmentFactory,
-            MonthlyMetricsFragmentFactory,
-            SectionHeaderFragmentFactory,
-            SubscriberTotalFragmentFactory,
-            GeographicFragmentFactory
-        )
-        
-        # Create monthly aggregation factory using the report's daily metrics and video counts
-        self.monthly_factory = MonthlyMetricsFactory(
+        return MonthlyMetricsFactory(
             self.report.daily_metrics,
             video_counts_by_month=self.report.video_counts_by_month,
             geographic_views_by_month=self.report.geographic_views_by_month,
             geographic_subscribers_by_month=self.report.geographic_subscribers_by_month
         )
+    
+    @cached_property
+    def _spreadsheet_factory(self):
+        """Base spreadsheet fragment factory wrapped by every fragment factory."""
+        from .factories import SpreadsheetFragmentFactory
+        return SpreadsheetFragmentFactory()
+    
+    @cached_property
+    def header_fragment_factory(self):
+        """Factory for the month header rows."""
+        from .factories import HeaderFragmentFactory
+        return HeaderFragmentFactory(self._spreadsheet_factory)
+    
+    @cached_property
+    def channel_fragment_factory(self):
+        """Factory for the channel info rows."""
+        from .factories import ChannelFragmentFactory
+        return ChannelFragmentFactory(self._spreadsheet_factory)
+    
+    @cached_property
+    def metrics_fragment_factory(self):
+        """Factory for the monthly metrics rows."""
+        from .factories import MonthlyMetricsFragmentFactory
+        return MonthlyMetricsFragmentFactory(self._spreadsheet_factory)
+    
+    @cached_property
+    def section_fragment_factory(self):
+        """Factory for section header rows."""
+        from .factories import SectionHeaderFragmentFactory
+        return SectionHeaderFragmentFactory(self._spreadsheet_factory)
+    
+    @cached_property
+    def subscriber_fragment_factory(self):
+        """Factory for the subscriber total row."""
+        from .factories import SubscriberTotalFragmentFactory
+        return SubscriberTotalFragmentFactory(self._spreadsheet_factory)
+    
+    @cached_property
+    def geographic_fragment_factory(self):
+        """Factory for the geographic rows."""
+        from .factories import GeographicFragmentFactory
+        return GeographicFragmentFactory(self._spreadsheet_factory)
+    
+    def _monthly_data(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate monthly data, reusing the on-disk cache when enabled.
         
-        # Create base spreadsheet fragment factory
-        spreadsheet_factory = SpreadsheetFragmentFactory()
+        Returns:
+            Monthly data keyed by YYYY-MM
+        """
+        if not self.use_cache:
+            return self.monthly_factory.create()
+        
+        from .monthly_data_cache import MonthlyDataCache
         
-        # Compose fragment factories with spreadsheet factory
-        self.header_fragment_factory = HeaderFragmentFactory(spreadsheet_factory)
-        self.channel_fragment_factory = ChannelFragmentFactory(spreadsheet_factory)
-        self.metrics_fragment_factory = MonthlyMetricsFragmentFactory(spreadsheet_factory)
-        self.section_fragment_factory = SectionHeaderFragmentFactory(spreadsheet_factory)
-        self.subscriber_fragment_factory = SubscriberTotalFragmentFactory(spreadsheet_factory)
-        self.geographic_fragment_factory = GeographicFragmentFactory(spreadsheet_factory)
+        cache = MonthlyDataCache()
+        key = cache.key_for(
+            self.report.daily_metrics,
+            self.report.video_counts_by_month,
+            self.report.geographic_views_by_month,
+            self.report.geographic_subscribers_by_month
+        )
+        monthly_data = cache.get(key)
+        if monthly_data is None:
+            monthly_data = self.monthly_factory.create()
+            cache.put(key, monthly_data)
+        return monthly_data
     
     def export(self) -> str:
         """Export YouTubeMetrics to Google Sheets in monthly columns format.
@@ -82,18 +155,19 @@ class YoutubeMetricsSheetsReport(GoogleSheetsReport):
             URL of the created/updated spreadsheet
         """
         from .monthly_columns_formatter import MonthlyColumnsFormatter
+        from .monthly_table import MonthlyTable
         
         spreadsheet_id = self.spreadsheet_id
         if not spreadsheet_id:
             spreadsheet_id = "1YBazG-UVCnSYwYjSKmXwaySVFDaQuifsL14aWTq7S9U"  # Default
         
-        # Get monthly data from the pre-created factory
-        monthly_data = self.monthly_factory.create()
+        # Get monthly data (cached on disk when enabled) and transpose it once
+        monthly_table = MonthlyTable.from_monthly_data(self._monthly_data())
         
         # Create and execute formatter with pre-initialized factories
         formatter = MonthlyColumnsFormatter(
             report=self.report,
-            monthly_data=monthly_data,
+            monthly_table=monthly_table,
             header_factory=self.header_fragment_factory,
             channel_factory=self.channel_fragment_factory,
             metrics_factory=self.metrics_fragment_factory,
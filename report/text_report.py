@@ -1,9 +1,35 @@
 """Text Report implementation."""
 
-from typing import Dict, Any, List
+from io import StringIO
+from typing import Callable, Dict, Any, List
 from .base import Report
 
 
+# Russian country names by ISO code, built once at import
+_COUNTRY_MAP_RU = {
+    'US': 'США',
+    'RU': 'Россия',
+    'GB': 'Великобритания',
+    'DE': 'Германия',
+    'FR': 'Франция',
+    'JP': 'Япония',
+    'CN': 'Китай',
+    'IN': 'Индия',
+    'BR': 'Бразилия',
+    'CA': 'Канада',
+    'AU': 'Австралия',
+    'IT': 'Италия',
+    'ES': 'Испания',
+    'MX': 'Мексика',
+    'KR': 'Южная Корея',
+    'UA': 'Украина',
+    'PL': 'Польша',
+    'NL': 'Нидерланды',
+    'TR': 'Турция',
+    'SE': 'Швеция'
+}
+
+
 class TextReport(Report):
     """Export dictionary to formatted text using decorator pattern."""
     
@@ -24,141 +50,144 @@ class TextReport(Report):
         Returns:
             Formatted text report
         """
-        lines = []
+        buf = StringIO()
         
         # Header
-        lines.append("=" * 60)
-        lines.append("YouTube Analytics Report")
+        buf.write("=" * 60 + "\n")
+        buf.write("YouTube Analytics Report\n")
         
         # Period if available
         if 'period' in self.data:
             period = self.data['period']
-            lines.append(f"Period: {period.get('start_date', 'N/A')} to {period.get('end_date', 'N/A')}")
+            buf.write(f"Period: {period.get('start_date', 'N/A')} to {period.get('end_date', 'N/A')}\n")
         
         # Generated time
         if 'generated_at' in self.data:
-            lines.append(f"Generated: {self.data['generated_at']}")
+            buf.write(f"Generated: {self.data['generated_at']}\n")
         
-        lines.append("=" * 60)
-        lines.append("")
+        buf.write("=" * 60 + "\n")
+        buf.write("\n")
         
         # Channel metrics
         if 'channel' in self.data:
-            self._add_channel_section(lines, self.data['channel'])
+            self._add_channel_section(buf, self.data['channel'])
         
         # Subscription dynamics
         if 'subscription_metrics' in self.data:
-            self._add_subscription_section(lines, self.data['subscription_metrics'])
+            self._add_subscription_section(buf, self.data['subscription_metrics'])
         
         # Views breakdown
         if 'views_breakdown' in self.data:
-            self._add_views_section(lines, self.data['views_breakdown'])
+            self._add_views_section(buf, self.data['views_breakdown'])
         
         # Revenue
-        self._add_revenue_section(lines, self.data.get('revenue_metrics'))
+        self._add_revenue_section(buf, self.data.get('revenue_metrics'))
         
         # Geographic views
         if 'geographic_views' in self.data:
-            self._add_geographic_views_section(lines, self.data['geographic_views'])
+            self._add_geographic_views_section(buf, self.data['geographic_views'])
         
         # Geographic subscribers
         if 'geographic_subscribers' in self.data:
-            self._add_geographic_subscribers_section(lines, self.data['geographic_subscribers'])
+            self._add_geographic_subscribers_section(buf, self.data['geographic_subscribers'])
         
         # Summary statistics
         if 'daily_metrics' in self.data:
-            self._add_summary_section(lines, self.data)
+            self._add_summary_section(buf, self.data)
         
-        return "\n".join(lines)
+        # Every line ends with a newline; the report itself does not
+        return buf.getvalue()[:-1]
     
-    def _add_channel_section(self, lines: List[str], channel: Dict[str, Any]) -> None:
+    def _add_channel_section(self, buf: StringIO, channel: Dict[str, Any]) -> None:
         """Add channel metrics section."""
-        lines.append("CHANNEL METRICS:")
-        lines.append(f"Количество роликов: {channel.get('video_count', 0)}")
+        buf.write("CHANNEL METRICS:\n")
+        buf.write(f"Количество роликов: {channel.get('video_count', 0)}\n")
         
         advertiser_count = channel.get('advertiser_count')
         if advertiser_count is not None:
-            lines.append(f"Количество рекламодателей: {advertiser_count}")
+            buf.write(f"Количество рекламодателей: {advertiser_count}\n")
         else:
-            lines.append("Количество рекламодателей: [Требуется ручной ввод]")
+            buf.write("Количество рекламодателей: [Требуется ручной ввод]\n")
         
         integrations = channel.get('integrations')
         if integrations:
-            lines.append(f"Интеграции: {integrations}")
+            buf.write(f"Интеграции: {integrations}\n")
         else:
-            lines.append("Интеграции Ghost Writer или Школьных продуктов: [Требуется ручной ввод]")
-        lines.append("")
+            buf.write("Интеграции Ghost Writer или Школьных продуктов: [Требуется ручной ввод]\n")
+        buf.write("\n")
     
-    def _add_subscription_section(self, lines: List[str], metrics: Dict[str, Any]) -> None:
+    def _add_subscription_section(self, buf: StringIO, metrics: Dict[str, Any]) -> None:
         """Add subscription dynamics section."""
-        lines.append("SUBSCRIPTION DYNAMICS:")
-        lines.append(f"Количество новых подписок: {metrics.get('subscribers_gained', 0)}")
-        lines.append(f"Количество отписок: {metrics.get('subscribers_lost', 0)}")
+        buf.write("SUBSCRIPTION DYNAMICS:\n")
+        buf.write(f"Количество новых подписок: {metrics.get('subscribers_gained', 0)}\n")
+        buf.write(f"Количество отписок: {metrics.get('subscribers_lost', 0)}\n")
         
         net_change = metrics.get('net_change', 0)
         sign = '+' if net_change >= 0 else ''
-        lines.append(f"Динамика подписок: {sign}{net_change}")
+        buf.write(f"Динамика подписок: {sign}{net_change}\n")
         
         change_percentage = metrics.get('change_percentage', 0)
         sign = '+' if change_percentage >= 0 else ''
-        lines.append(f"Динамика подписок, %: {sign}{change_percentage}%")
-        lines.append("")
+        buf.write(f"Динамика подписок, %: {sign}{change_percentage}%\n")
+        buf.write("\n")
     
-    def _add_views_section(self, lines: List[str], breakdown: Dict[str, Any]) -> None:
+    def _add_views_section(self, buf: StringIO, breakdown: Dict[str, Any]) -> None:
         """Add views breakdown section."""
-        lines.append("VIEWS BREAKDOWN:")
-        lines.append(f"Количество просмотров, total: {breakdown.get('total_views', 0)}")
-        lines.append(f"Количество просмотров, videos: {breakdown.get('video_views', 0)}")
-        lines.append(f"Количество просмотров, shorts: {breakdown.get('shorts_views', 0)}")
+        buf.write("VIEWS BREAKDOWN:\n")
+        buf.write(f"Количество просмотров, total: {breakdown.get('total_views', 0)}\n")
+        buf.write(f"Количество просмотров, videos: {breakdown.get('video_views', 0)}\n")
+        buf.write(f"Количество просмотров, shorts: {breakdown.get('shorts_views', 0)}\n")
         
         video_pct = breakdown.get('video_percentage', 0)
         shorts_pct = breakdown.get('shorts_percentage', 0)
-        lines.append(f"Соотношение: {video_pct}% videos vs. {shorts_pct}% shorts")
-        lines.append("")
+        buf.write(f"Соотношение: {video_pct}% videos vs. {shorts_pct}% shorts\n")
+        buf.write("\n")
     
-    def _add_revenue_section(self, lines: List[str], revenue: Dict[str, Any] = None) -> None:
+    def _add_revenue_section(self, buf: StringIO, revenue: Dict[str, Any] = None) -> None:
         """Add revenue section."""
-        lines.append("REVENUE:")
+        buf.write("REVENUE:\n")
         if revenue and revenue.get('has_revenue'):
             total_revenue = revenue.get('total_revenue', 0)
-            lines.append(f"AdSense: ${total_revenue:.2f}")
+            buf.write(f"AdSense: ${total_revenue:.2f}\n")
         else:
-            lines.append("AdSense: [Данные недоступны - требуется интеграция AdSense]")
-        lines.append("")
+            buf.write("AdSense: [Данные недоступны - требуется интеграция AdSense]\n")
+        buf.write("\n")
     
-    def _add_geographic_views_section(self, lines: List[str], geo_list: List[Dict[str, Any]]) -> None:
+    def _add_geographic_views_section(self, buf: StringIO, geo_list: List[Dict[str, Any]]) -> None:
         """Add geographic views section."""
         if not geo_list:
             return
         
-        lines.append("ГЕОГРАФИЯ ПРОСМОТРОВ (TOP 9):")
+        format_country = self._country_formatter()
+        buf.write("ГЕОГРАФИЯ ПРОСМОТРОВ (TOP 9):\n")
         for i, geo in enumerate(geo_list[:9], 1):
-            country = self._format_country(geo.get('country_code', geo.get('country_name', 'Unknown')))
+            country = format_country(geo.get('country_code') or geo.get('country_name', 'Unknown'))
             views = geo.get('views', 0)
-            lines.append(f"География, топ-{i}: {country} - {views} просмотров")
-        lines.append("")
+            buf.write(f"География, топ-{i}: {country} - {views} просмотров\n")
+        buf.write("\n")
     
-    def _add_geographic_subscribers_section(self, lines: List[str], geo_list: List[Dict[str, Any]]) -> None:
+    def _add_geographic_subscribers_section(self, buf: StringIO, geo_list: List[Dict[str, Any]]) -> None:
         """Add geographic subscribers section."""
         if not geo_list:
             return
         
-        lines.append("ГЕОГРАФИЯ ПОДПИСЧИКОВ (TOP 5):")
+        format_country = self._country_formatter()
+        buf.write("ГЕОГРАФИЯ ПОДПИСЧИКОВ (TOP 5):\n")
         for i, geo in enumerate(geo_list[:5], 1):
-            country = self._format_country(geo.get('country_code', geo.get('country_name', 'Unknown')))
+            country = format_country(geo.get('country_code') or geo.get('country_name', 'Unknown'))
             subscribers = geo.get('subscribers_gained', 0)
-            lines.append(f"топ-{i}: {country} - {subscribers} подписчиков")
-        lines.append("")
+            buf.write(f"топ-{i}: {country} - {subscribers} подписчиков\n")
+        buf.write("\n")
     
-    def _add_summary_section(self, lines: List[str], data: Dict[str, Any]) -> None:
+    def _add_summary_section(self, buf: StringIO, data: Dict[str, Any]) -> None:
         """Add summary statistics section."""
-        lines.append("SUMMARY STATISTICS:")
+        buf.write("SUMMARY STATISTICS:\n")
         
         total_watch_hours = data.get('total_watch_time_hours', 0)
-        lines.append(f"Total watch time: {total_watch_hours:.2f} hours")
+        buf.write(f"Total watch time: {total_watch_hours:.2f} hours\n")
         
         active_days = data.get('active_days_count', 0)
-        lines.append(f"Active days: {active_days}")
+        buf.write(f"Active days: {active_days}\n")
         
         # Calculate average views per video if possible
         if 'channel' in data:
@@ -167,32 +196,18 @@ class TextReport(Report):
             total_views = channel.get('total_view_count', 0)
             if video_count > 0:
                 avg_views = total_views / video_count
-                lines.append(f"Average views per video: {avg_views:.2f}")
+                buf.write(f"Average views per video: {avg_views:.2f}\n")
     
-    def _format_country(self, code: str) -> str:
-        """Format country code to readable name."""
+    def _country_formatter(self) -> Callable[[str], str]:
+        """Get the country formatter for the report language.
+        
+        The language is checked once here, so loops over countries call the
+        returned function directly.
+        
+        Returns:
+            Function mapping a country code to its readable name
+        """
         if self.language == 'ru':
-            country_map = {
-                'US': 'США',
-                'RU': 'Россия',
-                'GB': 'Великобритания',
-                'DE': 'Германия',
-                'FR': 'Франция',
-                'JP': 'Япония',
-                'CN': 'Китай',
-                'IN': 'Индия',
-                'BR': 'Бразилия',
-                'CA': 'Канада',
-                'AU': 'Австралия',
-                'IT': 'Италия',
-                'ES': 'Испания',
-                'MX': 'Мексика',
-                'KR': 'Южная Корея',
-                'UA': 'Украина',
-                'PL': 'Польша',
-                'NL': 'Нидерланды',
-                'TR': 'Турция',
-                'SE': 'Швеция'
-            }
-            return country_map.get(code, code)
-        return code
\ No newline at end of file
+            country_map_get = _COUNTRY_MAP_RU.get
+            return lambda code: country_map_get(code, code)
+        return lambda code: code
\ No newline at end of file
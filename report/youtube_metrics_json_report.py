@@ -1,7 +1,9 @@
 """JSON Report wrapper for YouTubeMetrics model."""
 
+import heapq
+from functools import cached_property
 from domain import YouTubeMetrics
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, TextIO, Tuple
 from datetime import datetime
 from .json_report import JsonReport
 
@@ -10,7 +12,8 @@ class YoutubeMetricsJsonReport:
     """JSON exporter for YouTubeMetrics model.
     
     Creates a structured JSON output with organized analytics data
-    similar to the spreadsheet report structure.
+    similar to the spreadsheet report structure. The wrapped model is
+    available as ``report``; its attributes are not proxied.
     """
     
     def __init__(self, report: YouTubeMetrics):
@@ -20,22 +23,63 @@ class YoutubeMetricsJsonReport:
             report: YouTubeMetrics instance to export
         """
         self.report = report
-        
-        # Initialize monthly data aggregation
-        self._initialize_monthly_data()
     
-    def _initialize_monthly_data(self):
-        """Initialize monthly aggregation of metrics."""
+    # Monthly aggregation runs on first use, so wrappers that never format
+    # the monthly section skip the pass over daily metrics
+    
+    @cached_property
+    def monthly_factory(self):
+        """Monthly aggregation factory using the report's daily metrics, video counts and geographic data."""
         from domain import MonthlyMetricsFactory
-        
-        # Create monthly aggregation factory using the report's daily metrics, video counts and geographic data
-        self.monthly_factory = MonthlyMetricsFactory(
+        return MonthlyMetricsFactory(
             self.report.daily_metrics,
             video_counts_by_month=self.report.video_counts_by_month,
             geographic_views_by_month=self.report.geographic_views_by_month,
             geographic_subscribers_by_month=self.report.geographic_subscribers_by_month
         )
-        self.monthly_data = self.monthly_factory.create()
+    
+    @cached_property
+    def monthly_data(self) -> Dict[str, Dict[str, Any]]:
+        """Monthly aggregated metrics keyed by YYYY-MM, in chronological order."""
+        return self.monthly_factory.create()
+    
+    @cached_property
+    def _daily_rollup(self) -> Tuple[List[Dict[str, Any]], int, int, int]:
+        """Build the daily rows and the summary totals in one pass over daily metrics.
+        
+        Returns:
+            Tuple of (daily rows, total views, total watch minutes, active days)
+        """
+        daily_rows = []
+        total_views = 0
+        total_watch_minutes = 0
+        active_days = 0
+        
+        append_row = daily_rows.append
+        to_float = float
+        
+        for dm in self.report.daily_metrics:
+            views = dm.views
+            watch_time_minutes = dm.watch_time_minutes
+            has_activity = dm.has_activity
+            
+            total_views += views
+            total_watch_minutes += watch_time_minutes
+            active_days += has_activity
+            
+            append_row({
+                "date": dm.date.isoformat(),
+                "views": views,
+                "watch_time_minutes": watch_time_minutes,
+                "average_view_duration_seconds": dm.average_view_duration_seconds,
+                "subscribers_gained": dm.subscribers_gained,
+                "subscribers_lost": dm.subscribers_lost,
+                "net_subscribers": dm.net_subscribers,
+                "revenue": to_float(dm.estimated_revenue),
+                "has_activity": has_activity
+            })
+        
+        return daily_rows, total_views, total_watch_minutes, active_days
     
     def _format_channel_section(self) -> Dict[str, Any]:
         """Format channel information section."""
@@ -53,19 +97,23 @@ class YoutubeMetricsJsonReport:
     
     def _format_summary_section(self) -> Dict[str, Any]:
         """Format summary metrics section."""
-        total_views = sum(dm.views for dm in self.report.daily_metrics) if self.report.daily_metrics else 0
-        total_watch_hours = sum(dm.watch_time_minutes for dm in self.report.daily_metrics) / 60 if self.report.daily_metrics else 0
+        report = self.report
+        sm = report.subscription_metrics
+        rm = report.revenue_metrics
+        
+        _, total_views, total_watch_minutes, active_days = self._daily_rollup
+        total_watch_hours = total_watch_minutes / 60 if report.daily_metrics else 0
         
         return {
             "title": "Summary Metrics",
             "data": {
                 "total_views": total_views,
                 "total_watch_time_hours": round(total_watch_hours, 2),
-                "subscribers_gained": self.report.subscription_metrics.subscribers_gained,
-                "subscribers_lost": self.report.subscription_metrics.subscribers_lost,
-                "net_subscribers": self.report.subscription_metrics.net_change,
-                "total_revenue": float(self.report.revenue_metrics.total_revenue) if self.report.revenue_metrics else 0,
-                "active_days": sum(1 for dm in self.report.daily_metrics if dm.has_activity)
+                "subscribers_gained": sm.subscribers_gained,
+                "subscribers_lost": sm.subscribers_lost,
+                "net_subscribers": sm.net_change,
+                "total_revenue": float(rm.total_revenue) if rm else 0,
+                "active_days": active_days
             }
         }
     
@@ -73,28 +121,36 @@ class YoutubeMetricsJsonReport:
         """Format monthly metrics section."""
         monthly_metrics = []
         
-        for month_key in sorted(self.monthly_data.keys()):
-            month_data = self.monthly_data[month_key]
+        # The factory already returns the months in chronological order
+        for month_key, month_data in self.monthly_data.items():
+            # Read the values used more than once a single time each
+            get = month_data.get
+            views_total = get('views', 0)
+            subscribers_gained = get('subscribers_gained', 0)
+            subscribers_lost = get('subscribers_lost', 0)
+            geographic_views_top = get('geographic_views_top')
+            geographic_subscribers_top = get('geographic_subscribers_top')
+            
             month_metric = {
                 "month": month_key,
-                "year": month_data.get('year'),
-                "month_number": month_data.get('month'),
-                "video_count": month_data.get('video_count', 0),  # Add video count
-                "views": month_data.get('views', 0),
-                "watch_time_hours": round(month_data.get('watch_time_minutes', 0) / 60, 2),
-                "average_view_duration_minutes": round(month_data.get('average_view_duration_seconds', 0) / 60, 2),
-                "subscribers_gained": month_data.get('subscribers_gained', 0),
-                "subscribers_lost": month_data.get('subscribers_lost', 0),
-                "net_subscribers": month_data.get('subscribers_gained', 0) - month_data.get('subscribers_lost', 0),
-                "revenue": float(month_data.get('estimated_revenue', 0)),
-                "active_days": month_data.get('active_days', 0)
+                "year": get('year'),
+                "month_number": get('month'),
+                "video_count": get('video_count', 0),  # Add video count
+                "views": views_total,
+                "watch_time_hours": round(get('watch_time_minutes', 0) / 60, 2),
+                "average_view_duration_minutes": round(get('average_view_duration_seconds', 0) / 60, 2),
+                "subscribers_gained": subscribers_gained,
+                "subscribers_lost": subscribers_lost,
+                "net_subscribers": subscribers_gained - subscribers_lost,
+                "revenue": float(get('estimated_revenue', 0)),
+                "active_days": get('active_days', 0)
             }
             
             # Add geographic data if available with percentages
-            if 'geographic_views_top' in month_data:
-                total_views = month_data.get('views', 0)
+            if geographic_views_top is not None:
+                total_views = views_total
                 top_views = []
-                for geo in month_data['geographic_views_top'][:5]:  # Top 5
+                for geo in geographic_views_top[:5]:  # Top 5
                     views = geo.get('views', 0)
                     percentage = round((views / total_views * 100), 1) if total_views > 0 else 0
                     top_views.append({
@@ -104,10 +160,10 @@ class YoutubeMetricsJsonReport:
                     })
                 month_metric['top_countries_by_views'] = top_views
             
-            if 'geographic_subscribers_top' in month_data:
-                total_subs = month_data.get('subscribers_gained', 0)
+            if geographic_subscribers_top is not None:
+                total_subs = subscribers_gained
                 top_subs = []
-                for geo in month_data['geographic_subscribers_top'][:5]:  # Top 5
+                for geo in geographic_subscribers_top[:5]:  # Top 5
                     subscribers = geo.get('subscribers', 0)
                     percentage = round((subscribers / total_subs * 100), 1) if total_subs > 0 else 0
                     top_subs.append({
@@ -126,46 +182,33 @@ class YoutubeMetricsJsonReport:
     
     def _format_daily_metrics_section(self) -> Dict[str, Any]:
         """Format daily metrics section."""
-        daily_metrics = []
-        
-        for dm in self.report.daily_metrics:
-            daily_metrics.append({
-                "date": dm.date.isoformat(),
-                "views": dm.views,
-                "watch_time_minutes": dm.watch_time_minutes,
-                "average_view_duration_seconds": dm.average_view_duration_seconds,
-                "subscribers_gained": dm.subscribers_gained,
-                "subscribers_lost": dm.subscribers_lost,
-                "net_subscribers": dm.net_subscribers,
-                "revenue": float(dm.estimated_revenue),
-                "has_activity": dm.has_activity
-            })
-        
         return {
             "title": "Daily Metrics",
-            "data": daily_metrics
+            "data": self._daily_rollup[0]
         }
     
     def _format_views_breakdown_section(self) -> Dict[str, Any]:
         """Format views breakdown section."""
+        breakdown = self.report.views_breakdown
         return {
             "title": "Views Breakdown",
-            "data": self.report.views_breakdown.to_dict() if self.report.views_breakdown else {}
+            "data": breakdown.to_dict() if breakdown else {}
         }
     
     def _format_revenue_section(self) -> Dict[str, Any]:
         """Format revenue metrics section."""
-        if not self.report.revenue_metrics:
+        rm = self.report.revenue_metrics
+        if not rm:
             return {
                 "title": "Revenue Metrics",
                 "data": {"message": "Revenue data not available"}
             }
         
-        revenue_data = self.report.revenue_metrics.to_dict()
+        revenue_data = rm.to_dict()
         
         # Add best performing day if available
-        if self.report.revenue_metrics.daily_revenue:
-            best_day = self.report.revenue_metrics.get_best_day()
+        if rm.daily_revenue:
+            best_day = rm.get_best_day()
             revenue_data['best_performing_day'] = {
                 "date": best_day.date.isoformat(),
                 "revenue": float(best_day.estimated_revenue)
@@ -178,45 +221,45 @@ class YoutubeMetricsJsonReport:
     
     def _format_geographic_section(self) -> Dict[str, Any]:
         """Format geographic metrics section."""
+        geographic_views = self.report.geographic_views
+        geographic_subscribers = self.report.geographic_subscribers
         geo_data = {
             "views_by_country": [],
             "subscribers_by_country": []
         }
         
         # Top countries by views
-        if self.report.geographic_views:
-            top_views = sorted(
-                self.report.geographic_views, 
-                key=lambda x: x.views, 
-                reverse=True
-            )[:10]
-            total_views = sum(gv.views for gv in self.report.geographic_views)
+        if geographic_views:
+            # Only the top 10 are needed, so skip sorting every country
+            top_views = heapq.nlargest(10, geographic_views, key=lambda x: x.views)
+            total_views = sum(gv.views for gv in geographic_views)
             if total_views > 0:
+                # One division up front; each row then only multiplies
+                percent_per_view = 100.0 / total_views
                 geo_data["views_by_country"] = [
                     {
                         "country": g.country_code,
                         "country_name": g.country_name,
                         "views": g.views,
                         "watch_time_minutes": g.watch_time_minutes,
-                        "percentage": round((g.views / total_views) * 100, 2)
+                        "percentage": round(g.views * percent_per_view, 2)
                     } for g in top_views
                 ]
         
         # Top countries by subscribers
-        if self.report.geographic_subscribers:
-            top_subs = sorted(
-                self.report.geographic_subscribers, 
-                key=lambda x: x.subscribers_gained, 
-                reverse=True
-            )[:10]
-            total_subs = sum(gs.subscribers_gained for gs in self.report.geographic_subscribers)
+        if geographic_subscribers:
+            top_subs = heapq.nlargest(
+                10, geographic_subscribers, key=lambda x: x.subscribers_gained
+            )
+            total_subs = sum(gs.subscribers_gained for gs in geographic_subscribers)
             if total_subs > 0:
+                percent_per_subscriber = 100.0 / total_subs
                 geo_data["subscribers_by_country"] = [
                     {
                         "country": g.country_code,
                         "country_name": g.country_name,
                         "subscribers": g.subscribers_gained,
-                        "percentage": round((g.subscribers_gained / total_subs) * 100, 2)
+                        "percentage": round(g.subscribers_gained * percent_per_subscriber, 2)
                     } for g in top_subs
                 ]
         
@@ -225,6 +268,31 @@ class YoutubeMetricsJsonReport:
             "data": geo_data
         }
     
+    def _metadata(self) -> Dict[str, Any]:
+        """Format the report metadata block."""
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "report_type": "YouTube Analytics Report",
+            "format_version": "2.0"
+        }
+    
+    def _section_formatters(self) -> Tuple[Tuple[str, Callable[[], Dict[str, Any]]], ...]:
+        """Get the report sections in output order.
+        
+        Returns:
+            Tuple of (section name, formatter) pairs
+        """
+        return (
+            ("channel", self._format_channel_section),
+            ("period", self._format_period_section),
+            ("summary", self._format_summary_section),
+            ("monthly_metrics", self._format_monthly_metrics_section),
+            ("daily_metrics", self._format_daily_metrics_section),
+            ("views_breakdown", self._format_views_breakdown_section),
+            ("revenue", self._format_revenue_section),
+            ("geographic", self._format_geographic_section)
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert YouTubeMetrics to structured dictionary.
         
@@ -232,23 +300,23 @@ class YoutubeMetricsJsonReport:
             Dictionary with organized sections similar to spreadsheet structure
         """
         return {
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "report_type": "YouTube Analytics Report",
-                "format_version": "2.0"
-            },
+            "metadata": self._metadata(),
             "sections": {
-                "channel": self._format_channel_section(),
-                "period": self._format_period_section(),
-                "summary": self._format_summary_section(),
-                "monthly_metrics": self._format_monthly_metrics_section(),
-                "daily_metrics": self._format_daily_metrics_section(),
-                "views_breakdown": self._format_views_breakdown_section(),
-                "revenue": self._format_revenue_section(),
-                "geographic": self._format_geographic_section()
+                name: format_section() for name, format_section in self._section_formatters()
             }
         }
     
+    def write(self, f: TextIO) -> None:
+        """Serialize the report into an open text file.
+        
+        The encoder writes into the file's buffer, so the JSON text is never
+        built as one string.
+        
+        Args:
+            f: File opened for writing in text mode
+        """
+        JsonReport(self.to_dict(), indent=2).write(f)
+    
     def export(self, filename: str = "youtube_analytics.json") -> str:
         """Export to JSON file.
         
@@ -258,20 +326,8 @@ class YoutubeMetricsJsonReport:
         Returns:
             Path to the exported file
         """
-        # Convert to structured dictionary
-        data_dict = self.to_dict()
-        
-        # Create JSON exporter and export
-        json_exporter = JsonReport(data_dict)
-        json_content = json_exporter.export()
-        
-        # Save to file
+        # Encode straight into the file instead of building the JSON string first
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(json_content)
+            self.write(f)
         
-        return filename
-    
-    # Delegate attribute access to the wrapped report
-    def __getattr__(self, name):
-        """Delegate attribute access to the wrapped report."""
-        return getattr(self.report, name)
\ No newline at end of file
+        return filename
\ No newline at end of file
@@ -3,26 +3,153 @@
 import os
 import pickle
 import json
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 from urllib.parse import urlencode
 import google_auth_oauthlib.flow
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from telegram_bot.config import CLIENT_SECRETS_FILE, SCOPES, TOKEN_DIR
 
+try:
+    # Optional: parses and encodes the token, secrets and state files faster than json
+    import orjson
+except ImportError:
+    orjson = None
 
+
+logger = logging.getLogger(__name__)
+
+# Loaded credentials by user, so repeated requests skip the token file; the
+# bot may run handlers concurrently, hence the lock
+_credentials_cache: 'OrderedDict[int, Credentials]' = OrderedDict()
+_credentials_lock = threading.Lock()
+
+# Built API services by user, with the credentials they were built for;
+# credentials refresh in place, so the services stay valid across refreshes
+_services_cache: 'OrderedDict[int, Tuple[Credentials, Any, Any]]' = OrderedDict()
+
+# Users kept in each cache; the least recently used are evicted beyond this
+MAX_CACHED_USERS = 256
+
+
+def _cache_get(cache: OrderedDict, user_id: int) -> Any:
+    """Look up a cached entry, marking it most recently used.
+    
+    Must be called with _credentials_lock held.
+    """
+    value = cache.get(user_id)
+    if value is not None:
+        cache.move_to_end(user_id)
+    return value
+
+
+def _cache_put(cache: OrderedDict, user_id: int, value: Any) -> None:
+    """Cache an entry, evicting the least recently used beyond MAX_CACHED_USERS.
+    
+    Must be called with _credentials_lock held.
+    """
+    cache[user_id] = value
+    cache.move_to_end(user_id)
+    while len(cache) > MAX_CACHED_USERS:
+        cache.popitem(last=False)
+
+
+# Path helpers are pure functions of the user id and the fixed TOKEN_DIR,
+# called several times per request, so their results are memoized
+
+@lru_cache(maxsize=1024)
 def get_token_file(user_id: int) -> str:
     """Get token file path for a user."""
+    return os.path.join(TOKEN_DIR, f'token_{user_id}.json')
+
+
+@lru_cache(maxsize=1024)
+def get_legacy_token_file(user_id: int) -> str:
+    """Get pickled token file path used before tokens were stored as JSON."""
     return os.path.join(TOKEN_DIR, f'token_{user_id}.pickle')
 
 
+def _read_json(path: str) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_json(path: str, obj: Any) -> None:
+    """Write an object as JSON, with orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f)
+
+
+def _write_token_file(token_file: str, credentials: Credentials) -> None:
+    """Store credentials as authorized-user JSON."""
+    with open(token_file, 'w') as f:
+        f.write(credentials.to_json())
+
+
+def _load_token_file(user_id: int):
+    """Load stored credentials for a user, migrating a legacy pickled token.
+    
+    Returns:
+        Credentials, or None if the user has no stored token
+    """
+    token_file = get_token_file(user_id)
+    if os.path.exists(token_file):
+        return Credentials.from_authorized_user_info(_read_json(token_file), SCOPES)
+    
+    legacy_file = get_legacy_token_file(user_id)
+    if not os.path.exists(legacy_file):
+        return None
+    
+    # One-time migration: rewrite the pickle as JSON so it is never unpickled again
+    with open(legacy_file, 'rb') as f:
+        credentials = pickle.load(f)
+    _write_token_file(token_file, credentials)
+    os.remove(legacy_file)
+    return credentials
+
+
+@lru_cache(maxsize=1024)
 def get_auth_state_file(user_id: int) -> str:
     """Get auth state file path for a user."""
     return os.path.join(TOKEN_DIR, f'auth_state_{user_id}.json')
 
 
+@lru_cache(maxsize=None)
+def _load_client_config() -> Tuple[Dict[str, Any], str]:
+    """Read the OAuth client secrets once per process.
+    
+    A missing or invalid file raises and is not cached, so it is read again
+    on the next attempt.
+    
+    Returns:
+        Tuple of (client config, client ID)
+    """
+    client_config = _read_json(CLIENT_SECRETS_FILE)
+    
+    if 'installed' in client_config:
+        client_id = client_config['installed']['client_id']
+    elif 'web' in client_config:
+        client_id = client_config['web']['client_id']
+    else:
+        raise ValueError("Invalid client_secrets.json format")
+    
+    return client_config, client_id
+
+
 def has_credentials(user_id: int) -> bool:
     """Check if user has stored credentials."""
-    return os.path.exists(get_token_file(user_id))
+    return os.path.exists(get_token_file(user_id)) or os.path.exists(get_legacy_token_file(user_id))
 
 
 def get_auth_url(user_id: int) -> str:
@@ -31,16 +158,8 @@ def get_auth_url(user_id: int) -> str:
     Note: Since we can't use the standard flow.run_local_server() in a bot context,
     we'll construct the URL manually for the out-of-band flow.
     """
-    # Load client secrets to get client ID
-    with open(CLIENT_SECRETS_FILE, 'r') as f:
-        client_config = json.load(f)
-    
-    if 'installed' in client_config:
-        client_id = client_config['installed']['client_id']
-    elif 'web' in client_config:
-        client_id = client_config['web']['client_id']
-    else:
-        raise ValueError("Invalid client_secrets.json format")
+    # Client secrets are read on first use only
+    client_config, client_id = _load_client_config()
     
     # Construct OAuth URL manually with all required parameters
     auth_params = {
@@ -55,16 +174,14 @@ def get_auth_url(user_id: int) -> str:
     
     auth_url = f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(auth_params)}"
     
-    # Debug: Print the URL to console
-    print(f"Generated OAuth URL: {auth_url}")
+    # The URL is per user, so it only goes to the debug log
+    logger.debug("Generated OAuth URL: %s", auth_url)
     
     # Store client config for later use
-    state_file = get_auth_state_file(user_id)
-    with open(state_file, 'w') as f:
-        json.dump({
-            'client_config': client_config,
-            'scopes': SCOPES
-        }, f)
+    _write_json(get_auth_state_file(user_id), {
+        'client_config': client_config,
+        'scopes': SCOPES
+    })
     
     return auth_url
 
@@ -72,9 +189,11 @@ def get_auth_url(user_id: int) -> str:
 def save_credentials(user_id: int, auth_code: str) -> bool:
     """Save user credentials after authentication."""
     try:
-        # Use the standard flow for exchanging the code
-        flow = google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file(
-            CLIENT_SECRETS_FILE,
+        # Use the standard flow for exchanging the code, with the client
+        # secrets already loaded
+        client_config, _ = _load_client_config()
+        flow = google_auth_oauthlib.flow.InstalledAppFlow.from_client_config(
+            client_config,
             scopes=SCOPES
         )
         
@@ -86,9 +205,9 @@ def save_credentials(user_id: int, auth_code: str) -> bool:
         credentials = flow.credentials
         
         # Save credentials
-        token_file = get_token_file(user_id)
-        with open(token_file, 'wb') as f:
-            pickle.dump(credentials, f)
+        _write_token_file(get_token_file(user_id), credentials)
+        with _credentials_lock:
+            _cache_put(_credentials_cache, user_id, credentials)
         
         # Clean up state file
         state_file = get_auth_state_file(user_id)
@@ -106,22 +225,25 @@ def save_credentials(user_id: int, auth_code: str) -> bool:
 
 def get_credentials(user_id: int):
     """Get valid credentials for a user."""
-    token_file = get_token_file(user_id)
-    
-    if not os.path.exists(token_file):
-        return None
+    with _credentials_lock:
+        credentials = _cache_get(_credentials_cache, user_id)
+    # expired already counts tokens about to expire, so they refresh early
+    if credentials is not None and not credentials.expired:
+        return credentials
     
     try:
-        with open(token_file, 'rb') as f:
-            credentials = pickle.load(f)
+        if credentials is None:
+            credentials = _load_token_file(user_id)
         
         # Refresh if expired
         if credentials and credentials.expired and credentials.refresh_token:
             credentials.refresh(Request())
             # Save refreshed credentials
-            with open(token_file, 'wb') as f:
-                pickle.dump(credentials, f)
+            _write_token_file(get_token_file(user_id), credentials)
         
+        if credentials:
+            with _credentials_lock:
+                _cache_put(_credentials_cache, user_id, credentials)
         return credentials
     except Exception as e:
         print(f"Error loading credentials: {e}")
@@ -134,9 +256,19 @@ def get_youtube_services(user_id: int):
     if not credentials:
         return None, None
     
+    with _credentials_lock:
+        cached = _cache_get(_services_cache, user_id)
+    if cached is not None and cached[0] is credentials:
+        return cached[1], cached[2]
+    
     try:
-        youtube_analytics = build('youtubeAnalytics', 'v2', credentials=credentials)
-        youtube_data = build('youtube', 'v3', credentials=credentials)
+        # Discovery documents bundled with the client library; no HTTP fetch
+        youtube_analytics = build('youtubeAnalytics', 'v2', credentials=credentials,
+                                  static_discovery=True, cache_discovery=False)
+        youtube_data = build('youtube', 'v3', credentials=credentials,
+                             static_discovery=True, cache_discovery=False)
+        with _credentials_lock:
+            _cache_put(_services_cache, user_id, (credentials, youtube_analytics, youtube_data))
         return youtube_analytics, youtube_data
     except Exception as e:
         print(f"Error building YouTube services: {e}")
@@ -145,13 +277,17 @@ def get_youtube_services(user_id: int):
 
 def delete_credentials(user_id: int) -> bool:
     """Delete user credentials (for re-authentication)."""
-    token_file = get_token_file(user_id)
+    with _credentials_lock:
+        _credentials_cache.pop(user_id, None)
+        _services_cache.pop(user_id, None)
+    
     state_file = get_auth_state_file(user_id)
     
     deleted = False
-    if os.path.exists(token_file):
-        os.remove(token_file)
-        deleted = True
+    for token_file in (get_token_file(user_id), get_legacy_token_file(user_id)):
+        if os.path.exists(token_file):
+            os.remove(token_file)
+            deleted = True
     
     if os.path.exists(state_file):
         os.remove(state_file)
@@ -1,5 +1,6 @@
 """Simple Telegram bot for YouTube channel statistics."""
 
+import asyncio
 import logging
 from telegram import Update
 from telegram.ext import (
@@ -161,9 +162,10 @@ async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                 month_query = arg
                 break  # Take the first valid month format
     
-    # Get statistics (always for user's own channel)
+    # Get statistics (always for user's own channel); the API calls block,
+    # so they run in a worker thread and the event loop keeps serving updates
     try:
-        stats_text = get_channel_statistics(user_id, None, month_query)
+        stats_text = await asyncio.to_thread(get_channel_statistics, user_id, None, month_query)
         
         # Edit the loading message with results
         await loading_msg.edit_text(stats_text, parse_mode='Markdown')
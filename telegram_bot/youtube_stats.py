@@ -2,6 +2,7 @@
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -10,8 +11,18 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from youtube.youtube_api import YouTubeAPIClient
 from youtube.youtube_metrics_factory import YouTubeMetricsFactory
+from youtube.response_cache import ResponseCache
 from domain import DateRange
 from telegram_bot.auth import get_credentials, get_youtube_services
+from telegram_bot.config import TOKEN_DIR
+
+
+# API responses shared by every user's requests; keys include the user's credentials
+_RESPONSE_CACHE = ResponseCache(os.path.join(TOKEN_DIR, 'cache'))
+
+# Runs the channel lookup and upload count alongside the metrics fetch; kept
+# apart from the metrics factory's pool, which create() waits on
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='youtube-channel')
 
 
 def get_own_channel(youtube_data_service) -> tuple[Optional[str], str]:
@@ -61,31 +72,49 @@ def get_video_count_for_period(youtube_data, channel_id: str, start_date, end_da
         Number of videos uploaded in the period
     """
     try:
-        # Convert dates to RFC 3339 format for YouTube API
-        start_datetime = datetime.combine(start_date, datetime.min.time()).isoformat() + 'Z'
-        end_datetime = datetime.combine(end_date, datetime.max.time()).isoformat() + 'Z'
+        # Count from the channel's uploads playlist: playlistItems.list costs
+        # 1 quota unit per page (search.list costs 100) and lists every
+        # upload, so the count is exact. The playlist is newest first, so
+        # paging stops at the first page reaching back before the period.
+        channel_response = youtube_data.channels().list(
+            part='contentDetails',
+            id=channel_id
+        ).execute()
+        if not channel_response.get('items'):
+            return 0
+        uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+        
+        # Publish times are RFC 3339 UTC timestamps, so their date part
+        # compares directly with the ISO period bounds
+        start_iso = start_date.isoformat()
+        end_iso = end_date.isoformat()
         
         video_count = 0
         next_page_token = None
+        reached_start = False
         
         while True:
-            # Search for videos uploaded by the channel in the specified period
-            request = youtube_data.search().list(
-                part='id',
-                channelId=channel_id,
-                type='video',
-                publishedAfter=start_datetime,
-                publishedBefore=end_datetime,
+            request = youtube_data.playlistItems().list(
+                part='contentDetails',
+                playlistId=uploads_playlist_id,
                 maxResults=50,
                 pageToken=next_page_token
             )
             
             response = request.execute()
-            video_count += len(response.get('items', []))
+            for item in response.get('items', []):
+                published_at = item['contentDetails'].get('videoPublishedAt')
+                if not published_at:
+                    continue
+                published_date = published_at[:10]
+                if published_date < start_iso:
+                    reached_start = True
+                elif published_date <= end_iso:
+                    video_count += 1
             
-            # Check if there are more pages
+            # Check if there are more pages that can still be in the period
             next_page_token = response.get('nextPageToken')
-            if not next_page_token:
+            if reached_start or not next_page_token:
                 break
                 
         return video_count
@@ -95,6 +124,23 @@ def get_video_count_for_period(youtube_data, channel_id: str, start_date, end_da
         return 0
 
 
+def _resolve_channel_and_count(youtube_data, start_date, end_date) -> tuple[Optional[str], str, int]:
+    """Resolve the user's own channel and count its uploads in a period.
+    
+    Args:
+        youtube_data: YouTube Data API service
+        start_date: Start date of the period
+        end_date: End date of the period
+        
+    Returns:
+        Tuple of (channel_id, channel_name, videos uploaded in the period)
+    """
+    channel_id, channel_name = resolve_channel(youtube_data, None)
+    if not channel_id:
+        return None, channel_name, 0
+    return channel_id, channel_name, get_video_count_for_period(youtube_data, channel_id, start_date, end_date)
+
+
 def get_channel_statistics(user_id: int, channel_query: Optional[str] = None, month_query: Optional[str] = None) -> str:
     """Get YouTube channel statistics formatted for Telegram.
     
@@ -112,13 +158,8 @@ def get_channel_statistics(user_id: int, channel_query: Optional[str] = None, mo
         if not youtube_analytics or not youtube_data:
             return "❌ Authentication required. Please use /auth command first."
         
-        # Always get user's own channel
-        channel_id, channel_name = resolve_channel(youtube_data, None)
-        if not channel_id:
-            return "❌ Could not find your channel. Please check your authentication."
-        
         # Create API client wrapper
-        api_client = YouTubeAPIClient()
+        api_client = YouTubeAPIClient(response_cache=_RESPONSE_CACHE)
         api_client._youtube_analytics = youtube_analytics
         api_client._youtube_data = youtube_data
         
@@ -157,8 +198,9 @@ def get_channel_statistics(user_id: int, channel_query: Optional[str] = None, mo
         
         period = DateRange(start_date=start_date, end_date=end_date)
         
-        # Get video count for the period
-        videos_uploaded = get_video_count_for_period(youtube_data, channel_id, start_date, end_date)
+        # Always get user's own channel and its video count for the period;
+        # these requests run while the metrics below are being fetched
+        channel_future = _EXECUTOR.submit(_resolve_channel_and_count, youtube_data, start_date, end_date)
         
         # Get metrics using factory (always include revenue for own channel)
         factory = YouTubeMetricsFactory(
@@ -170,6 +212,10 @@ def get_channel_statistics(user_id: int, channel_query: Optional[str] = None, mo
         # Fetch metrics
         metrics = factory.create()
         
+        channel_id, channel_name, videos_uploaded = channel_future.result()
+        if not channel_id:
+            return "❌ Could not find your channel. Please check your authentication."
+        
         # Format response
         response = f"📊 *{channel_name} Statistics*\n"
         
@@ -217,14 +263,20 @@ def get_channel_statistics(user_id: int, channel_query: Optional[str] = None, mo
         
         # Watch time
         if metrics.daily_metrics:
-            total_watch_minutes = sum(d.watch_time_minutes for d in metrics.daily_metrics)
+            # Watch time, views and active days summed in one pass
+            total_watch_minutes = 0
+            total_views = 0
+            active_days = 0
+            for d in metrics.daily_metrics:
+                total_watch_minutes += d.watch_time_minutes
+                total_views += d.views
+                active_days += d.has_activity
             total_watch_hours = total_watch_minutes / 60
             response += f"⏱ *Watch Time:* {total_watch_hours:,.0f} hours\n"
             
             # Average views per day
-            active_days = sum(1 for d in metrics.daily_metrics if d.has_activity)
             if active_days > 0:
-                avg_daily_views = sum(d.views for d in metrics.daily_metrics) / active_days
+                avg_daily_views = total_views / active_days
                 response += f"📅 *Avg Daily Views:* {avg_daily_views:,.0f}\n"
         
         # Revenue
@@ -1,9 +1,11 @@
 """Services for YouTube Analytics."""
 
 from .youtube_api import YouTubeAPIClient
+from .response_cache import ResponseCache
 from .youtube_metrics_factory import YouTubeMetricsFactory
 
 __all__ = [
     'YouTubeAPIClient',
+    'ResponseCache',
     'YouTubeMetricsFactory'
 ]
\ No newline at end of file
@@ -37,36 +37,28 @@ class YouTubeChannelFactory(Factory):
         # Fetch from YouTube API
         youtube_data = self.api_client.get_data_service()
         
+        # Raw statistics straight from the response; stays empty, so every
+        # count falls back to 0, if no channel is found or the request fails
+        stats = {}
+        
         try:
+            # Only the statistics part is read, so nothing else is requested
             request = youtube_data.channels().list(
-                part="statistics,contentDetails",
+                part="statistics",
                 mine=True
             )
             response = self.api_client.execute_request(request)
             
             if response and response.get('items'):
                 stats = response['items'][0]['statistics']
-                kwargs['video_count'] = int(stats.get('videoCount', 0))
-                kwargs['subscriber_count'] = int(stats.get('subscriberCount', 0))
-                kwargs['total_view_count'] = int(stats.get('viewCount', 0))
-                # Set defaults for optional fields
-                kwargs.setdefault('advertiser_count', 0)
-                kwargs.setdefault('integrations', '')
-            else:
-                # No channel data found
-                kwargs['video_count'] = 0
-                kwargs['subscriber_count'] = 0
-                kwargs['total_view_count'] = 0
-                kwargs['advertiser_count'] = 0
-                kwargs['integrations'] = ''
         except Exception as e:
             print(f"Error fetching channel statistics: {e}")
-            # Set defaults on error
-            kwargs['video_count'] = 0
-            kwargs['subscriber_count'] = 0
-            kwargs['total_view_count'] = 0
-            kwargs['advertiser_count'] = 0
-            kwargs['integrations'] = ''
         
-        # Create Channel with fetched data
-        return Channel(**kwargs)
\ No newline at end of file
+        # Create Channel with fetched data; advertiser_count and integrations
+        # keep the Channel defaults unless provided
+        return Channel(
+            video_count=int(stats.get('videoCount', 0)),
+            subscriber_count=int(stats.get('subscriberCount', 0)),
+            total_view_count=int(stats.get('viewCount', 0)),
+            **kwargs
+        )
\ No newline at end of file
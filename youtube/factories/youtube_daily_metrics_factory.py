@@ -1,7 +1,7 @@
 """YouTube API factory for DailyMetrics."""
 
 from typing import TYPE_CHECKING, Optional, List
-from datetime import datetime
+from datetime import date
 from domain import Factory, DailyMetrics
 
 if TYPE_CHECKING:
@@ -56,19 +56,19 @@ class YouTubeDailyMetricsFactory(Factory):
             response = self.api_client.execute_request(request)
             
             if response and response.get('rows'):
-                for row in response['rows']:
-                    date_obj = datetime.strptime(row[0], '%Y-%m-%d').date()
-                    
-                    # Create DailyMetrics directly
-                    daily_metric = DailyMetrics(
-                        date=date_obj,
-                        views=row[1] if len(row) > 1 else 0,
-                        watch_time_minutes=row[2] if len(row) > 2 else 0,
-                        average_view_duration_seconds=row[3] if len(row) > 3 else 0,
-                        subscribers_gained=row[4] if len(row) > 4 else 0,
-                        subscribers_lost=row[5] if len(row) > 5 else 0
-                    )
-                    daily_metrics.append(daily_metric)
+                rows = response['rows']
+                # Report rows all share the query's column layout, so metrics
+                # missing from the response are padded with 0 once here
+                # rather than length-checked on every row
+                padding = [0] * (6 - len(rows[0]))
+                from_iso = date.fromisoformat
+                
+                # Create DailyMetrics directly; the columns follow the
+                # DailyMetrics field order after the date
+                daily_metrics = [
+                    DailyMetrics(from_iso(row[0]), *row[1:6], *padding)
+                    for row in rows
+                ]
             
         except Exception as e:
             print(f"Error fetching daily metrics: {e}")
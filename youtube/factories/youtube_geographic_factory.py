@@ -1,12 +1,17 @@
 """YouTube API factory for GeographicMetrics."""
 
-from typing import TYPE_CHECKING, List
+import logging
+from operator import attrgetter
+from typing import TYPE_CHECKING, List, Tuple
 from domain import Factory, GeographicMetrics
 
 if TYPE_CHECKING:
     from youtube.youtube_api import YouTubeAPIClient
 
 
+logger = logging.getLogger(__name__)
+
+
 class YouTubeGeographicFactory(Factory):
     """Factory that fetches geographic metrics from YouTube API.
     
@@ -53,28 +58,30 @@ class YouTubeGeographicFactory(Factory):
                 )
                 response = self.api_client.execute_request(request)
                 
-                # Debug the raw response
-                print(f"Raw API response: {response}")
+                # Debug the raw response; formatted only when debug logging is on
+                logger.debug("Raw API response: %s", response)
                 
                 if response and response.get('rows'):
-                    print(f"Geographic views API returned {len(response['rows'])} countries")
-                    print(f"First few rows: {response['rows'][:5] if len(response['rows']) > 5 else response['rows']}")
+                    rows = response['rows']
+                    print(f"Geographic views API returned {len(rows)} countries")
+                    logger.debug("First few rows: %s", rows[:5])
                     
-                    # Process ALL countries returned by the API
-                    for row in response['rows']:
-                        geo = GeographicMetrics(
-                            country_code=row[0],
-                            views=row[1],
-                            watch_time_minutes=row[2],
-                            subscribers_gained=0  # Default value for views fetch
-                        )
-                        geo_metrics.append(geo)
-                        print(f"Added country {row[0]} with {row[1]} views")
+                    # Process ALL countries returned by the API. Positional
+                    # arguments follow the GeographicMetrics field order, and
+                    # subscribers keep their default of 0 for a views fetch
+                    geo_metrics = [
+                        GeographicMetrics(country_code, views, watch_time_minutes)
+                        for country_code, views, watch_time_minutes, *_ in rows
+                    ]
                     
                     print(f"Created {len(geo_metrics)} GeographicMetrics objects")
-                    # Log total views for debugging
-                    total_views = sum(g.views for g in geo_metrics)
-                    print(f"Total views from all countries: {total_views}")
+                    # Per-country lines and the total only cost anything with debug logging on
+                    if logger.isEnabledFor(logging.DEBUG):
+                        total_views = 0
+                        for geo in geo_metrics:
+                            total_views += geo.views
+                            logger.debug("Added country %s with %s views", geo.country_code, geo.views)
+                        logger.debug("Total views from all countries: %s", total_views)
                 else:
                     print("No geographic data returned by API")
                         
@@ -92,18 +99,70 @@ class YouTubeGeographicFactory(Factory):
                 
                 if response and response.get('rows'):
                     print(f"Geographic subscribers API returned {len(response['rows'])} countries")
-                    # Process ALL countries returned by the API
-                    for row in response['rows']:
-                        geo = GeographicMetrics(
-                            country_code=row[0],
-                            views=0,  # Default value for subscribers fetch
-                            watch_time_minutes=0,  # Default value for subscribers fetch
-                            subscribers_gained=row[1]
-                        )
-                        geo_metrics.append(geo)
+                    # Process ALL countries returned by the API; views and
+                    # watch time are 0 for a subscribers fetch
+                    geo_metrics = [
+                        GeographicMetrics(row[0], 0, 0, row[1])
+                        for row in response['rows']
+                    ]
                     print(f"Created {len(geo_metrics)} GeographicMetrics objects for subscribers")
                         
         except Exception as e:
             print(f"Error fetching geographic {fetch_type}: {e}")
         
-        return geo_metrics
\ No newline at end of file
+        return geo_metrics
+    
+    def create_combined(self,
+                        start_date: str,
+                        end_date: str) -> Tuple[List[GeographicMetrics], List[GeographicMetrics]]:
+        """Fetch geographic views and subscribers with a single API query.
+        
+        The Analytics API reports all three metrics by country in one
+        response, so this costs one request and quota unit instead of the
+        two made by create("views") and create("subscribers"). The
+        subscriber ordering is done here instead of by the API.
+        
+        Args:
+            start_date: Start date for API query (ISO format)
+            end_date: End date for API query (ISO format)
+            
+        Returns:
+            Tuple of (views by country, subscribers by country), shaped and
+            ordered like the results of create("views") and create("subscribers")
+        """
+        youtube_analytics = self.api_client.get_analytics_service()
+        views_metrics = []
+        subscribers_metrics = []
+        
+        try:
+            request = youtube_analytics.reports().query(
+                ids='channel==MINE',
+                startDate=start_date,
+                endDate=end_date,
+                metrics='views,estimatedMinutesWatched,subscribersGained',
+                dimensions='country',
+                sort='-views'
+            )
+            response = self.api_client.execute_request(request)
+            logger.debug("Raw API response: %s", response)
+            
+            if response and response.get('rows'):
+                rows = response['rows']
+                print(f"Geographic API returned {len(rows)} countries")
+                
+                views_metrics = [
+                    GeographicMetrics(country_code, views, watch_time_minutes)
+                    for country_code, views, watch_time_minutes, *_ in rows
+                ]
+                subscribers_metrics = sorted(
+                    (GeographicMetrics(row[0], 0, 0, row[3]) for row in rows),
+                    key=attrgetter('subscribers_gained'),
+                    reverse=True
+                )
+            else:
+                print("No geographic data returned by API")
+        
+        except Exception as e:
+            print(f"Error fetching geographic views and subscribers: {e}")
+        
+        return views_metrics, subscribers_metrics
\ No newline at end of file
@@ -1,6 +1,6 @@
 """YouTube API factory for fetching geographic metrics by month."""
 
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 from datetime import datetime, date, timedelta
 from domain import GeographicMetrics, Factory
 
@@ -20,6 +20,7 @@ class YouTubeMonthlyGeographicFactory(Factory):
         self.api_client = api_client
     
     def _fetch_month_geographic(self, 
+                               youtube_analytics: Any,
                                year: int, 
                                month: int, 
                                fetch_type: str,
@@ -27,6 +28,7 @@ class YouTubeMonthlyGeographicFactory(Factory):
         """Fetch geographic data for a specific month.
         
         Args:
+            youtube_analytics: YouTube Analytics API service
             year: Year to fetch
             month: Month to fetch (1-12)
             fetch_type: "views" or "subscribers"
@@ -42,7 +44,6 @@ class YouTubeMonthlyGeographicFactory(Factory):
         else:
             end_date = date(year, month + 1, 1) - timedelta(days=1)
         
-        youtube_analytics = self.api_client.get_analytics_service()
         geo_metrics = []
         
         try:
@@ -59,14 +60,12 @@ class YouTubeMonthlyGeographicFactory(Factory):
                 response = self.api_client.execute_request(request)
                 
                 if response and response.get('rows'):
-                    for row in response['rows']:
-                        geo = GeographicMetrics(
-                            country_code=row[0],
-                            views=row[1],
-                            watch_time_minutes=row[2] if len(row) > 2 else 0,
-                            subscribers_gained=0
-                        )
-                        geo_metrics.append(geo)
+                    # Built straight from the rows; positional arguments follow
+                    # the GeographicMetrics field order
+                    geo_metrics = [
+                        GeographicMetrics(row[0], row[1], row[2] if len(row) > 2 else 0)
+                        for row in response['rows']
+                    ]
                         
             elif fetch_type == "subscribers":
                 request = youtube_analytics.reports().query(
@@ -81,14 +80,10 @@ class YouTubeMonthlyGeographicFactory(Factory):
                 response = self.api_client.execute_request(request)
                 
                 if response and response.get('rows'):
-                    for row in response['rows']:
-                        geo = GeographicMetrics(
-                            country_code=row[0],
-                            views=0,
-                            watch_time_minutes=0,
-                            subscribers_gained=row[1]
-                        )
-                        geo_metrics.append(geo)
+                    geo_metrics = [
+                        GeographicMetrics(row[0], 0, 0, row[1])
+                        for row in response['rows']
+                    ]
                         
         except Exception as e:
             print(f"Error fetching geographic {fetch_type} for {year}-{month:02d}: {e}")
@@ -119,6 +114,9 @@ class YouTubeMonthlyGeographicFactory(Factory):
         start = datetime.fromisoformat(start_date).date()
         end = datetime.fromisoformat(end_date).date()
         
+        # One service lookup serves every month's queries
+        youtube_analytics = self.api_client.get_analytics_service()
+        
         # Iterate through each month in the period
         current = start
         while current <= end:
@@ -126,6 +124,7 @@ class YouTubeMonthlyGeographicFactory(Factory):
             
             # Fetch geographic data for this month
             geo_data = self._fetch_month_geographic(
+                youtube_analytics,
                 current.year,
                 current.month,
                 fetch_type,
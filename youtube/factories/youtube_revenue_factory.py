@@ -1,7 +1,7 @@
 """YouTube API factory for RevenueMetrics."""
 
 from typing import TYPE_CHECKING, Optional
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 from domain import Factory, RevenueMetrics, DateRange, DailyMetrics
 
@@ -9,6 +9,25 @@ if TYPE_CHECKING:
     from youtube.youtube_api import YouTubeAPIClient
 
 
+# Shared zero amount; Decimal is immutable, so one instance serves every default
+_ZERO = Decimal('0')
+
+
+def _to_decimal(value) -> Decimal:
+    """Convert an API revenue amount to Decimal.
+    
+    Floats go through their shortest repr, which round-trips exactly, rather
+    than Decimal(float), which would expose binary rounding error.
+    
+    Args:
+        value: Amount from an API row (float, int or None)
+        
+    Returns:
+        Decimal amount, zero for missing or zero values
+    """
+    return Decimal(repr(value)) if value else _ZERO
+
+
 class YouTubeRevenueFactory(Factory):
     """Factory that fetches revenue metrics from YouTube API."""
     
@@ -41,14 +60,13 @@ class YouTubeRevenueFactory(Factory):
             period = kwargs.get('period')
             if not period and start_date and end_date:
                 # Convert string dates to date objects
-                from datetime import datetime as dt
-                start_dt = dt.strptime(start_date, '%Y-%m-%d').date() if isinstance(start_date, str) else start_date
-                end_dt = dt.strptime(end_date, '%Y-%m-%d').date() if isinstance(end_date, str) else end_date
+                start_dt = date.fromisoformat(start_date) if isinstance(start_date, str) else start_date
+                end_dt = date.fromisoformat(end_date) if isinstance(end_date, str) else end_date
                 period = DateRange(start_date=start_dt, end_date=end_dt)
             return RevenueMetrics(
-                total_revenue=kwargs.get('total_revenue', Decimal('0')),
-                ad_revenue=kwargs.get('ad_revenue', Decimal('0')),
-                red_partner_revenue=kwargs.get('red_partner_revenue', Decimal('0')),
+                total_revenue=kwargs.get('total_revenue', _ZERO),
+                ad_revenue=kwargs.get('ad_revenue', _ZERO),
+                red_partner_revenue=kwargs.get('red_partner_revenue', _ZERO),
                 period=period,
                 daily_revenue=kwargs.get('daily_revenue', []),
                 is_monetized=kwargs.get('is_monetized', False)
@@ -59,14 +77,13 @@ class YouTubeRevenueFactory(Factory):
             period = kwargs.get('period')
             if not period and start_date and end_date:
                 # Convert string dates to date objects
-                from datetime import datetime as dt
-                start_dt = dt.strptime(start_date, '%Y-%m-%d').date() if isinstance(start_date, str) else start_date
-                end_dt = dt.strptime(end_date, '%Y-%m-%d').date() if isinstance(end_date, str) else end_date
+                start_dt = date.fromisoformat(start_date) if isinstance(start_date, str) else start_date
+                end_dt = date.fromisoformat(end_date) if isinstance(end_date, str) else end_date
                 period = DateRange(start_date=start_dt, end_date=end_dt)
             return RevenueMetrics(
-                total_revenue=kwargs.get('total_revenue', Decimal('0')),
-                ad_revenue=kwargs.get('ad_revenue', Decimal('0')),
-                red_partner_revenue=kwargs.get('red_partner_revenue', Decimal('0')),
+                total_revenue=kwargs.get('total_revenue', _ZERO),
+                ad_revenue=kwargs.get('ad_revenue', _ZERO),
+                red_partner_revenue=kwargs.get('red_partner_revenue', _ZERO),
                 period=period,
                 daily_revenue=kwargs.get('daily_revenue', []),
                 is_monetized=kwargs.get('is_monetized', False)
@@ -88,17 +105,26 @@ class YouTubeRevenueFactory(Factory):
             
             if response and response.get('rows'):
                 daily_revenue = []
-                total_revenue = Decimal('0')
-                total_ad_revenue = Decimal('0')
-                total_red_revenue = Decimal('0')
+                total_revenue = _ZERO
+                total_ad_revenue = _ZERO
+                total_red_revenue = _ZERO
+                
+                rows = response['rows']
+                # Report rows all share the query's column layout, so the
+                # optional revenue columns are checked once, not per row
+                has_ad_revenue = len(rows[0]) > 2
+                has_red_revenue = len(rows[0]) > 3
                 
-                for row in response['rows']:
-                    date_obj = datetime.strptime(row[0], '%Y-%m-%d').date()
-                    estimated = Decimal(str(row[1])) if row[1] else Decimal('0')
-                    ad_rev = Decimal(str(row[2])) if len(row) > 2 and row[2] else Decimal('0')
-                    red_rev = Decimal(str(row[3])) if len(row) > 3 and row[3] else Decimal('0')
+                to_decimal = _to_decimal
+                from_iso = date.fromisoformat
+                append_day = daily_revenue.append
+                for row in rows:
+                    date_obj = from_iso(row[0])
+                    estimated = to_decimal(row[1])
+                    ad_rev = to_decimal(row[2]) if has_ad_revenue else _ZERO
+                    red_rev = to_decimal(row[3]) if has_red_revenue else _ZERO
                     
-                    daily_revenue.append(DailyMetrics(
+                    append_day(DailyMetrics(
                         date=date_obj,
                         views=0,  # Revenue data doesn't include views
                         watch_time_minutes=0,
@@ -121,9 +147,9 @@ class YouTubeRevenueFactory(Factory):
                 kwargs['is_monetized'] = total_revenue > 0
             else:
                 # No revenue data
-                kwargs['total_revenue'] = Decimal('0')
-                kwargs['ad_revenue'] = Decimal('0')
-                kwargs['red_partner_revenue'] = Decimal('0')
+                kwargs['total_revenue'] = _ZERO
+                kwargs['ad_revenue'] = _ZERO
+                kwargs['red_partner_revenue'] = _ZERO
                 kwargs['daily_revenue'] = []
                 kwargs['is_monetized'] = False
                 
@@ -136,12 +162,11 @@ class YouTubeRevenueFactory(Factory):
         
         # Create RevenueMetrics with fetched data
         # Convert string dates to date objects for DateRange
-        from datetime import datetime as dt
-        start_dt = dt.strptime(start_date, '%Y-%m-%d').date() if isinstance(start_date, str) else start_date
-        end_dt = dt.strptime(end_date, '%Y-%m-%d').date() if isinstance(end_date, str) else end_date
+        start_dt = date.fromisoformat(start_date) if isinstance(start_date, str) else start_date
+        end_dt = date.fromisoformat(end_date) if isinstance(end_date, str) else end_date
         period = DateRange(start_date=start_dt, end_date=end_dt)
         return RevenueMetrics(
-            total_revenue=kwargs.get('total_revenue', Decimal('0')),
+            total_revenue=kwargs.get('total_revenue', _ZERO),
             ad_revenue=kwargs.get('ad_revenue'),
             red_partner_revenue=kwargs.get('red_partner_revenue'),
             period=period,
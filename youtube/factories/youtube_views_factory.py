@@ -62,22 +62,34 @@ class YouTubeViewsFactory(Factory):
             )
             data = self.api_client.execute_request(request)
             
-            # Calculate views breakdown
+            # Sum views per raw API content type first: a long range has one
+            # row per day and type but only a handful of distinct types
+            views_by_api_value = {}
+            get_views = views_by_api_value.get
+            for row in data.get('rows', []):
+                if len(row) > 2:
+                    api_value = row[1]
+                    views_by_api_value[api_value] = get_views(api_value, 0) + row[2]
+            
+            # Calculate views breakdown, classifying each distinct type once
             video_views = 0
             shorts_views = 0
             live_stream_views = 0
             
-            for row in data.get('rows', []):
-                if len(row) > 2:
-                    content_type = ContentType.from_api_value(row[1])
-                    views = row[2]
-                    
-                    if content_type == ContentType.VIDEO:
-                        video_views += views
-                    elif content_type == ContentType.SHORTS:
-                        shorts_views += views
-                    elif content_type == ContentType.LIVE_STREAM:
-                        live_stream_views += views
+            from_api_value = ContentType.from_api_value
+            VIDEO = ContentType.VIDEO
+            SHORTS = ContentType.SHORTS
+            LIVE_STREAM = ContentType.LIVE_STREAM
+            
+            for api_value, views in views_by_api_value.items():
+                content_type = from_api_value(api_value)
+                
+                if content_type == VIDEO:
+                    video_views += views
+                elif content_type == SHORTS:
+                    shorts_views += views
+                elif content_type == LIVE_STREAM:
+                    live_stream_views += views
             
             kwargs['total_views'] = video_views + shorts_views + live_stream_views
             kwargs['video_views'] = video_views
@@ -0,0 +1,203 @@
+"""Memory and on-disk cache for YouTube API responses."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+class ResponseCache:
+    """Stores API responses as JSON files keyed by the request and the user.
+    
+    YouTube Analytics data lags a few days behind and revenue estimates are
+    revised for weeks, so a response is only kept indefinitely once its
+    period ended long enough ago to have settled. Anything that can still
+    change (recent analytics, channel statistics, upload lists) expires
+    after a short time to live.
+    
+    Responses are account data, so the cache directory is created readable
+    by its owner only, like the token files.
+    """
+    
+    DEFAULT_DIRECTORY = os.path.join(
+        os.path.expanduser('~'), '.cache', 'youtube-statistics', 'api'
+    )
+    
+    # Seconds a response that may still change stays valid
+    DEFAULT_TTL = 15 * 60
+    
+    # Days after its end date before a period's analytics stop changing
+    SETTLED_DAYS = 3
+    
+    # Days after its end date before a period's revenue estimates are final
+    REVENUE_SETTLED_DAYS = 45
+    
+    # Responses held in memory; the least recently used are evicted beyond this
+    DEFAULT_MAX_MEMORY_ENTRIES = 256
+    
+    # Cache files kept; the least recently written beyond this are removed
+    DEFAULT_MAX_FILES = 4096
+    
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        max_memory_entries: int = DEFAULT_MAX_MEMORY_ENTRIES,
+        max_files: int = DEFAULT_MAX_FILES
+    ):
+        """Initialize the cache.
+        
+        Args:
+            directory: Directory for cache files (defaults to ~/.cache/youtube-statistics/api)
+            ttl: Seconds before a response for a period that is not over expires
+            max_memory_entries: Number of responses held in memory
+            max_files: Number of cache files kept after each write
+        """
+        self.directory = directory or self.DEFAULT_DIRECTORY
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_files = max_files
+        # Responses already read or fetched in this process, with the time they
+        # were stored; requests may run on several threads, hence the lock
+        self._memory: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._memory_lock = threading.Lock()
+    
+    @staticmethod
+    def key_for(request: Any) -> Optional[str]:
+        """Hash a request and the identity of its user into a cache key.
+        
+        Queries such as channel==MINE answer differently per account, so the
+        key includes the refresh token of the request's credentials.
+        
+        Args:
+            request: API request object
+        
+        Returns:
+            Hex digest identifying the request, or None if it cannot be cached
+        """
+        credentials = getattr(getattr(request, 'http', None), 'credentials', None)
+        identity = getattr(credentials, 'refresh_token', None)
+        uri = getattr(request, 'uri', None)
+        if not identity or not uri:
+            return None
+        
+        body = getattr(request, 'body', None) or ''
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        payload = '\n'.join((identity, getattr(request, 'method', 'GET'), uri, body))
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def max_age_for(self, request: Any) -> Optional[float]:
+        """Get how long a request's response stays valid.
+        
+        Args:
+            request: API request object
+        
+        Returns:
+            Seconds until the response expires, or None if it never does
+        """
+        query = parse_qs(urlsplit(request.uri).query)
+        end_dates = query.get('endDate')
+        if not end_dates:
+            return self.ttl
+        
+        metrics = ','.join(query.get('metrics', ())).lower()
+        settled_days = self.REVENUE_SETTLED_DAYS if 'revenue' in metrics else self.SETTLED_DAYS
+        settled_before = (date.today() - timedelta(days=settled_days)).isoformat()
+        if end_dates[0] < settled_before:
+            return None
+        return self.ttl
+    
+    def _path(self, key: str) -> str:
+        """Get the cache file path for a key."""
+        return os.path.join(self.directory, f'{key}.json')
+    
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Load a cached response.
+        
+        Args:
+            key: Cache key from key_for
+            max_age: Seconds the response stays valid, or None for no limit
+        
+        Returns:
+            Response, or None if it is not cached, expired or unreadable
+        """
+        now = time.time()
+        
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is not None and (max_age is None or now - entry[0] <= max_age):
+            return entry[1]
+        
+        path = self._path(key)
+        try:
+            stored_at = os.path.getmtime(path)
+            if max_age is not None and now - stored_at > max_age:
+                return None
+            with open(path, 'rb') as f:
+                response = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        self._remember(key, stored_at, response)
+        return response
+    
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        """Store a response; the file is replaced atomically.
+        
+        Failing to write the cache is not an error for the request, so
+        problems are only reported.
+        
+        Args:
+            key: Cache key from key_for
+            response: API response to store
+        """
+        self._remember(key, time.time(), response)
+        try:
+            # Owner-only directory; mkstemp already creates the files as 0600
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(response, f, ensure_ascii=False)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._prune()
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: could not write API response cache: {e}")
+    
+    def _remember(self, key: str, stored_at: float, response: Dict[str, Any]) -> None:
+        """Hold a response in memory, evicting the least recently used beyond max_memory_entries."""
+        with self._memory_lock:
+            self._memory[key] = (stored_at, response)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+    
+    def _prune(self) -> None:
+        """Remove the oldest cache files beyond max_files."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.json'):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+        
+        entries.sort(reverse=True)
+        for _, path in entries[self.max_files:]:
+            try:
+                os.remove(path)
+            except OSError:
+                # Already removed by a concurrent request
+                pass
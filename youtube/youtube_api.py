@@ -2,31 +2,41 @@
 
 import os
 import pickle
+import threading
 from typing import Tuple, Optional, Any
+import google_auth_httplib2
 import google_auth_oauthlib.flow
+import httplib2
 from googleapiclient.discovery import build
 from google.auth.transport.requests import Request
+from .response_cache import ResponseCache
 
 
 class YouTubeAPIClient:
     """Handles YouTube API authentication and service creation."""
     
     def __init__(self, client_secrets_file: str = "client_secrets.json",
-                 token_file: str = "token.pickle"):
+                 token_file: str = "token.pickle",
+                 response_cache: Optional[ResponseCache] = None):
         """Initialize API client.
         
         Args:
             client_secrets_file: Path to OAuth client secrets file
             token_file: Path to store/load authentication token
+            response_cache: Optional cache answering repeated requests without the API
         """
         self.client_secrets_file = client_secrets_file
         self.token_file = token_file
+        self.response_cache = response_cache
         self.scopes = [
             'https://www.googleapis.com/auth/yt-analytics.readonly',
             'https://www.googleapis.com/auth/youtube.readonly'
         ]
         self._youtube_analytics = None
         self._youtube_data = None
+        # httplib2 connections are not thread-safe, so each thread executing
+        # requests gets its own authorized transport
+        self._local = threading.local()
     
     def authenticate(self) -> Any:
         """Authenticate and return credentials."""
@@ -60,8 +70,11 @@ class YouTubeAPIClient:
         """
         if not self._youtube_analytics or not self._youtube_data:
             credentials = self.authenticate()
-            self._youtube_analytics = build('youtubeAnalytics', 'v2', credentials=credentials)
-            self._youtube_data = build('youtube', 'v3', credentials=credentials)
+            # Discovery documents bundled with the client library; no HTTP fetch
+            self._youtube_analytics = build('youtubeAnalytics', 'v2', credentials=credentials,
+                                            static_discovery=True, cache_discovery=False)
+            self._youtube_data = build('youtube', 'v3', credentials=credentials,
+                                       static_discovery=True, cache_discovery=False)
         
         return self._youtube_analytics, self._youtube_data
     
@@ -75,9 +88,33 @@ class YouTubeAPIClient:
         _, data = self.get_services()
         return data
     
+    def _thread_http(self, request: Any) -> Optional[Any]:
+        """Get the calling thread's authorized transport for a request.
+        
+        Args:
+            request: API request object
+            
+        Returns:
+            AuthorizedHttp for the request's credentials, or None to use the
+            request's own transport
+        """
+        credentials = getattr(request.http, 'credentials', None)
+        if credentials is None:
+            return None
+        
+        http = getattr(self._local, 'http', None)
+        if http is None or http.credentials is not credentials:
+            http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+    
     def execute_request(self, request: Any) -> dict:
         """Execute API request with error handling.
         
+        Safe to call from several threads at once: the request is sent over
+        a transport owned by the calling thread. With a response cache, a
+        response still valid in the cache is returned without calling the API.
+        
         Args:
             request: API request object
             
@@ -87,8 +124,19 @@ class YouTubeAPIClient:
         Raises:
             Exception: If API request fails
         """
+        cache = self.response_cache
+        key = cache.key_for(request) if cache is not None else None
+        if key is not None:
+            response = cache.get(key, cache.max_age_for(request))
+            if response is not None:
+                return response
+        
         try:
-            return request.execute()
+            response = request.execute(http=self._thread_http(request))
         except Exception as e:
             print(f"API request failed: {e}")
-            raise
\ No newline at end of file
+            raise
+        
+        if key is not None:
+            cache.put(key, response)
+        return response
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Composite factory that unifies all YouTube Analytics factories."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from typing import Optional, TYPE_CHECKING
 from decimal import Decimal
@@ -9,6 +10,10 @@ if TYPE_CHECKING:
     from youtube.youtube_api import YouTubeAPIClient
 
 
+# Shared by all reports: runs the independent API fetches concurrently
+_EXECUTOR = ThreadPoolExecutor(max_workers=6, thread_name_prefix='youtube-fetch')
+
+
 class YouTubeMetricsFactory(Factory):
     """Composite factory that encapsulates all individual factories for YouTube Analytics."""
     
@@ -87,67 +92,109 @@ class YouTubeMetricsFactory(Factory):
         
         print(f"Fetching analytics for period: {start_date} to {end_date}")
         
+        start_iso = start_date.isoformat()
+        end_iso = end_date.isoformat()
+        
+        # Build the API services up front so worker threads share them
+        # instead of racing to create them
+        self.api_client.get_services()
+        
+        # The fetches do not depend on each other, so they run concurrently
+        # and the total wait is the slowest request rather than their sum
+        submit = _EXECUTOR.submit
+        
         # Fetch channel statistics
         print("Fetching channel statistics...")
-        channel = self.channel_factory.create()
+        channel_future = submit(self.channel_factory.create)
         
         # Fetch video counts by month
         print("Fetching video upload counts by month...")
-        video_counts_by_month = self.video_list_factory.create(
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat()
+        video_counts_future = submit(
+            self.video_list_factory.create,
+            start_date=start_iso,
+            end_date=end_iso
         )
         
         # Fetch monthly geographic data
         print("Fetching monthly geographic views...")
-        geographic_views_by_month = self.monthly_geographic_factory.create(
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat(),
+        geographic_views_by_month_future = submit(
+            self.monthly_geographic_factory.create,
+            start_date=start_iso,
+            end_date=end_iso,
             fetch_type='views',
             max_results=9
         )
         
         print("Fetching monthly geographic subscribers...")
-        geographic_subscribers_by_month = self.monthly_geographic_factory.create(
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat(),
+        geographic_subscribers_by_month_future = submit(
+            self.monthly_geographic_factory.create,
+            start_date=start_iso,
+            end_date=end_iso,
             fetch_type='subscribers',
             max_results=5
         )
         
-        # Fetch daily metrics first (needed for subscription aggregation)
+        # Fetch daily metrics (needed for subscription aggregation)
         print("Fetching daily metrics...")
-        daily_metrics = self.daily_metrics_factory.create(
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat()
-        )
-        
-        # Calculate subscription metrics from daily metrics
-        print("Calculating subscription metrics...")
-        total_subscribers_gained = sum(dm.subscribers_gained for dm in daily_metrics) if daily_metrics else 0
-        total_subscribers_lost = sum(dm.subscribers_lost for dm in daily_metrics) if daily_metrics else 0
-        subscription_metrics = SubscriptionMetrics(
-            subscribers_gained=total_subscribers_gained,
-            subscribers_lost=total_subscribers_lost,
-            period=period_obj
+        daily_metrics_future = submit(
+            self.daily_metrics_factory.create,
+            start_date=start_iso,
+            end_date=end_iso
         )
         
         # Fetch views breakdown
         print("Fetching views breakdown...")
-        views_breakdown = self.views_breakdown_factory.create(
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat()
+        views_breakdown_future = submit(
+            self.views_breakdown_factory.create,
+            start_date=start_iso,
+            end_date=end_iso
         )
         
         # Fetch revenue metrics (if not skipped)
+        revenue_future = None
         if not self.skip_revenue:
             print("Fetching revenue metrics...")
-            revenue_metrics = self.revenue_factory.create(
-                start_date=start_date.isoformat(),
-                end_date=end_date.isoformat()
+            revenue_future = submit(
+                self.revenue_factory.create,
+                start_date=start_iso,
+                end_date=end_iso
             )
         else:
             print("Skipping revenue metrics (--skip-revenue flag set)")
+        
+        # Fetch geographic views and subscribers with one query
+        print("Fetching geographic views and subscribers...")
+        geographic_future = submit(
+            self.geographic_factory.create_combined,
+            start_date=start_iso,
+            end_date=end_iso
+        )
+        
+        channel = channel_future.result()
+        video_counts_by_month = video_counts_future.result()
+        geographic_views_by_month = geographic_views_by_month_future.result()
+        geographic_subscribers_by_month = geographic_subscribers_by_month_future.result()
+        daily_metrics = daily_metrics_future.result()
+        views_breakdown = views_breakdown_future.result()
+        geographic_views, geographic_subscribers = geographic_future.result()
+        
+        # Calculate subscription metrics from daily metrics, both totals in one pass
+        print("Calculating subscription metrics...")
+        total_subscribers_gained = 0
+        total_subscribers_lost = 0
+        for dm in daily_metrics:
+            total_subscribers_gained += dm.subscribers_gained
+            total_subscribers_lost += dm.subscribers_lost
+        subscription_metrics = SubscriptionMetrics(
+            subscribers_gained=total_subscribers_gained,
+            subscribers_lost=total_subscribers_lost,
+            period=period_obj
+        )
+        
+        if revenue_future is not None:
+            # Revenue errors are raised here and fail the whole report
+            revenue_metrics = revenue_future.result()
+        else:
             # Create empty revenue metrics
             revenue_metrics = RevenueMetrics(
                 total_revenue=Decimal('0'),
@@ -157,22 +204,6 @@ class YouTubeMetricsFactory(Factory):
                 daily_revenue=[]
             )
         
-        # Fetch geographic views
-        print("Fetching geographic views...")
-        geographic_views = self.geographic_factory.create(
-            fetch_type='views',
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat()
-        )
-        
-        # Fetch geographic subscribers
-        print("Fetching geographic subscribers...")
-        geographic_subscribers = self.geographic_factory.create(
-            fetch_type='subscribers',
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat()
-        )
-        
         # Create YouTubeMetrics model
         report = YouTubeMetrics(
             channel=channel,